@@ -4,17 +4,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Coroutine
+from operator import methodcaller
+from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_ADDRESS, CONF_DEVICE_ID, Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from .const import CONF_BED_TYPE, CONF_HAS_MASSAGE, CONF_MOTOR_COUNT, DOMAIN
-from .coordinator import AdjustableBedCoordinator
+from .coordinator import AdjustableBedConfigEntry, AdjustableBedCoordinator
 
 # Service constants
 SERVICE_GOTO_PRESET = "goto_preset"
@@ -22,6 +25,18 @@ SERVICE_SAVE_PRESET = "save_preset"
 SERVICE_STOP_ALL = "stop_all"
 ATTR_PRESET = "preset"
 
+PRESET_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.ensure_list,
+        vol.Required(ATTR_PRESET): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+    }
+)
+STOP_ALL_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE_ID): cv.ensure_list,
+    }
+)
+
 # Timeout for initial connection at startup
 SETUP_TIMEOUT = 15.0
 
@@ -35,22 +50,61 @@ PLATFORMS: list[Platform] = [
 ]
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: AdjustableBedConfigEntry) -> bool:
     """Set up Adjustable Bed from a config entry."""
-    _LOGGER.info(
-        "Setting up Adjustable Bed integration for %s (address: %s, type: %s, motors: %s, massage: %s)",
-        entry.title,
-        entry.data.get(CONF_ADDRESS),
-        entry.data.get(CONF_BED_TYPE),
-        entry.data.get(CONF_MOTOR_COUNT),
-        entry.data.get(CONF_HAS_MASSAGE),
-    )
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "Setting up Adjustable Bed integration for %s (address: %s, type: %s, motors: %s, massage: %s)",
+            entry.title,
+            entry.data.get(CONF_ADDRESS),
+            entry.data.get(CONF_BED_TYPE),
+            entry.data.get(CONF_MOTOR_COUNT),
+            entry.data.get(CONF_HAS_MASSAGE),
+        )
 
     coordinator = AdjustableBedCoordinator(hass, entry)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
-    # Connect to the bed with a timeout to avoid blocking startup forever
-    _LOGGER.debug("Attempting initial connection to bed (timeout: %.0fs)...", SETUP_TIMEOUT)
+    entry.runtime_data = coordinator
+
+    # Platforms only need the coordinator object, not a live connection,
+    # so set them up while the initial connection is being established
+    _LOGGER.debug(
+        "Attempting initial connection to bed (timeout: %.0fs) while setting up platforms: %s",
+        SETUP_TIMEOUT,
+        PLATFORMS,
+    )
+    connect_result, platforms_result = await asyncio.gather(
+        _async_initial_connect(coordinator, entry),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+        return_exceptions=True,
+    )
+
+    if isinstance(platforms_result, BaseException):
+        # Tear down whichever platforms did load before dropping the connection
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        await coordinator.async_disconnect()
+        raise platforms_result
+
+    if isinstance(connect_result, BaseException):
+        # Tear down the platforms that were set up alongside the failed connection
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        raise connect_result
+
+    _LOGGER.info("Successfully connected to bed at %s", entry.data.get(CONF_ADDRESS))
+
+    # Register services if not already registered
+    await _async_register_services(hass)
+
+    _LOGGER.info("Adjustable Bed integration setup complete for %s", entry.title)
+    return True
+
+
+async def _async_initial_connect(
+    coordinator: AdjustableBedCoordinator, entry: AdjustableBedConfigEntry
+) -> None:
+    """Connect to the bed, raising ConfigEntryNotReady if it cannot be reached."""
+    # Use a timeout to avoid blocking startup forever
     try:
         async with asyncio.timeout(SETUP_TIMEOUT):
             connected = await coordinator.async_connect()
@@ -66,134 +120,104 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "Check that the bed is powered on and in range of your Bluetooth adapter/proxy."
         )
 
-    _LOGGER.info("Successfully connected to bed at %s", entry.data.get(CONF_ADDRESS))
-
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    _LOGGER.debug("Setting up platforms: %s", PLATFORMS)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-
-    # Register services if not already registered
-    await _async_register_services(hass)
-
-    _LOGGER.info("Adjustable Bed integration setup complete for %s", entry.title)
-    return True
-
 
 async def _async_register_services(hass: HomeAssistant) -> None:
     """Register Adjustable Bed services."""
     if hass.services.has_service(DOMAIN, SERVICE_GOTO_PRESET):
         return  # Services already registered
 
-    async def _get_coordinator_from_device(
-        hass: HomeAssistant, device_id: str
-    ) -> AdjustableBedCoordinator | None:
-        """Get coordinator from device ID."""
+    def _get_coordinators(call: ServiceCall) -> list[AdjustableBedCoordinator]:
+        """Get the coordinators for the devices targeted by a service call."""
         device_registry = dr.async_get(hass)
-        device = device_registry.async_get(device_id)
-        if not device:
-            return None
-
-        for entry_id in device.config_entries:
-            if entry_id in hass.data.get(DOMAIN, {}):
-                return hass.data[DOMAIN][entry_id]
-        return None
+        coordinators: list[AdjustableBedCoordinator] = []
+        for device_id in call.data.get(CONF_DEVICE_ID, []):
+            device = device_registry.async_get(device_id)
+            if not device:
+                continue
+            for entry_id in device.config_entries:
+                entry = hass.config_entries.async_get_entry(entry_id)
+                if (
+                    entry is not None
+                    and entry.domain == DOMAIN
+                    and entry.state is ConfigEntryState.LOADED
+                ):
+                    coordinators.append(entry.runtime_data)
+                    break
+        return coordinators
+
+    async def _async_gather_commands(commands: list[Coroutine[Any, Any, None]]) -> None:
+        """Send commands to all targeted beds at once, then raise the first failure."""
+        for result in await asyncio.gather(*commands, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
 
     async def handle_goto_preset(call: ServiceCall) -> None:
         """Handle goto_preset service call."""
-        preset = call.data[ATTR_PRESET]
-        device_ids = call.data.get(CONF_DEVICE_ID, [])
-
-        for device_id in device_ids:
-            coordinator = await _get_coordinator_from_device(hass, device_id)
-            if coordinator:
-                await coordinator.async_execute_controller_command(
-                    lambda ctrl: ctrl.preset_memory(preset)
-                )
+        command = methodcaller("preset_memory", call.data[ATTR_PRESET])
+        await _async_gather_commands(
+            [
+                coordinator.async_execute_controller_command(command)
+                for coordinator in _get_coordinators(call)
+            ]
+        )
 
     async def handle_save_preset(call: ServiceCall) -> None:
         """Handle save_preset service call."""
-        preset = call.data[ATTR_PRESET]
-        device_ids = call.data.get(CONF_DEVICE_ID, [])
-
-        for device_id in device_ids:
-            coordinator = await _get_coordinator_from_device(hass, device_id)
-            if coordinator:
-                await coordinator.async_execute_controller_command(
-                    lambda ctrl: ctrl.program_memory(preset),
-                    cancel_running=False,
-                )
+        command = methodcaller("program_memory", call.data[ATTR_PRESET])
+        await _async_gather_commands(
+            [
+                coordinator.async_execute_controller_command(command, cancel_running=False)
+                for coordinator in _get_coordinators(call)
+            ]
+        )
 
     async def handle_stop_all(call: ServiceCall) -> None:
         """Handle stop_all service call."""
-        device_ids = call.data.get(CONF_DEVICE_ID, [])
-
-        for device_id in device_ids:
-            coordinator = await _get_coordinator_from_device(hass, device_id)
-            if coordinator:
-                await coordinator.async_stop_command()
+        await _async_gather_commands(
+            [coordinator.async_stop_command() for coordinator in _get_coordinators(call)]
+        )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GOTO_PRESET,
         handle_goto_preset,
-        schema=vol.Schema(
-            {
-                vol.Required(CONF_DEVICE_ID): cv.ensure_list,
-                vol.Required(ATTR_PRESET): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=4)
-                ),
-            }
-        ),
+        schema=PRESET_SERVICE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SAVE_PRESET,
         handle_save_preset,
-        schema=vol.Schema(
-            {
-                vol.Required(CONF_DEVICE_ID): cv.ensure_list,
-                vol.Required(ATTR_PRESET): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=4)
-                ),
-            }
-        ),
+        schema=PRESET_SERVICE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_STOP_ALL,
         handle_stop_all,
-        schema=vol.Schema(
-            {
-                vol.Required(CONF_DEVICE_ID): cv.ensure_list,
-            }
-        ),
+        schema=STOP_ALL_SERVICE_SCHEMA,
     )
 
     _LOGGER.debug("Registered Adjustable Bed services")
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: AdjustableBedConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading Adjustable Bed integration for %s", entry.title)
 
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator: AdjustableBedCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
         _LOGGER.debug("Disconnecting from bed...")
-        await coordinator.async_disconnect()
+        await entry.runtime_data.async_disconnect()
         _LOGGER.info("Successfully unloaded Adjustable Bed integration for %s", entry.title)
 
         # Unregister services if this was the last entry
-        if not hass.data[DOMAIN]:
+        if not hass.config_entries.async_loaded_entries(DOMAIN):
             _async_unregister_services(hass)
 
     return unload_ok
 
 
-async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def _async_update_listener(hass: HomeAssistant, entry: AdjustableBedConfigEntry) -> None:
     """Handle options updates."""
     await hass.config_entries.async_reload(entry.entry_id)
 
@@ -7,7 +7,6 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable, Coroutine, Any
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -21,9 +20,8 @@ from .const import (
     BED_TYPE_SOLACE,
     CONF_BED_TYPE,
     CONF_HAS_MASSAGE,
-    DOMAIN,
 )
-from .coordinator import AdjustableBedCoordinator
+from .coordinator import AdjustableBedConfigEntry, AdjustableBedCoordinator
 from .entity import AdjustableBedEntity
 
 if TYPE_CHECKING:
@@ -258,11 +256,11 @@ BUTTON_DESCRIPTIONS: tuple[AdjustableBedButtonEntityDescription, ...] = (
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: AdjustableBedConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Adjustable Bed button entities."""
-    coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     has_massage = entry.data.get(CONF_HAS_MASSAGE, False)
     bed_type = entry.data.get(CONF_BED_TYPE)
 
@@ -289,10 +287,7 @@ class AdjustableBedButton(AdjustableBedEntity, ButtonEntity):
         description: AdjustableBedButtonEntityDescription,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{coordinator.address}_{description.key}"
-        self._attr_translation_key = description.translation_key
+        super().__init__(coordinator, description)
 
     async def async_press(self) -> None:
         """Handle button press."""
@@ -17,6 +17,9 @@ CONF_MOTOR_PULSE_DELAY_MS: Final = "motor_pulse_delay_ms"
 # Special value for auto adapter selection
 ADAPTER_AUTO: Final = "auto"
 
+# Dispatcher signal for position updates, formatted with (address, position key)
+SIGNAL_POSITION_UPDATE: Final = f"{DOMAIN}_position_update_{{}}_{{}}"
+
 # Bed types
 BED_TYPE_LINAK: Final = "linak"
 BED_TYPE_RICHMAT: Final = "richmat"
@@ -15,6 +15,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from habluetooth.const import ConnectParams
 
@@ -56,6 +57,7 @@ from .const import (
     LEGGETT_VARIANT_OKIN,
     RICHMAT_VARIANT_NORDIC,
     RICHMAT_VARIANT_WILINKE,
+    SIGNAL_POSITION_UPDATE,
 )
 
 if TYPE_CHECKING:
@@ -70,6 +72,7 @@ CONNECTION_TIMEOUT = 30.0  # Timeout for BLE connection attempts
 DISCONNECT_TIMEOUT = 40.0
 DISCONNECT_TIMEOUT_NO_SENSING = 40.0  # Disconnect when idle (must be > preset time)
 POST_CONNECT_DELAY = 1.0  # Delay after connection to let it stabilize
+POSITION_UPDATE_DEBOUNCE = 0.1  # Coalesce position notifications while motors move
 
 # BLE connection parameters - use conservative/compatible values
 # These are in units of 1.25ms for intervals, 10ms for timeout
@@ -110,12 +113,23 @@ class AdjustableBedCoordinator:
         self._lock = asyncio.Lock()
         self._command_lock = asyncio.Lock()  # Separate lock for command serialization
         self._connecting: bool = False  # Track if we're actively connecting
+        self._connected: bool = False  # Maintained by connect/disconnect handlers
         self._intentional_disconnect: bool = False  # Track intentional disconnects to skip auto-reconnect
         self._cancel_command = asyncio.Event()  # Signal to cancel current command
 
         # Position data from notifications
         self._position_data: dict[str, float] = {}
-        self._position_callbacks: set[Callable[[dict[str, float]], None]] = set()
+        self._pending_positions: set[str] = set()
+        self._signalled_positions: dict[str, float] = {}
+        self._position_flush_timer: asyncio.TimerHandle | None = None
+
+        # Device info is shared by all entities of this bed
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._address)},
+            name=self._name,
+            manufacturer=self._get_manufacturer(),
+            model=self._get_model(),
+        )
 
         _LOGGER.debug(
             "Coordinator initialized for %s at %s (type: %s, motors: %d, massage: %s, disable_angle_sensing: %s, adapter: %s)",
@@ -226,7 +240,7 @@ class AdjustableBedCoordinator:
     @property
     def is_connected(self) -> bool:
         """Return whether we are currently connected to the bed."""
-        return self._client is not None and self._client.is_connected
+        return self._connected
 
     @property
     def is_connecting(self) -> bool:
@@ -241,12 +255,7 @@ class AdjustableBedCoordinator:
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for this bed."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._address)},
-            name=self._name,
-            manufacturer=self._get_manufacturer(),
-            model=self._get_model(),
-        )
+        return self._device_info
 
     def _get_manufacturer(self) -> str:
         """Get manufacturer name based on bed type."""
@@ -279,7 +288,7 @@ class AdjustableBedCoordinator:
 
     async def _async_connect_locked(self, reset_timer: bool = True) -> bool:
         """Connect to the bed (must hold lock)."""
-        if self._client is not None and self._client.is_connected:
+        if self._connected:
             _LOGGER.debug("Already connected to %s, reusing connection", self._address)
             if reset_timer:
                 self._reset_disconnect_timer()
@@ -593,6 +602,7 @@ class AdjustableBedCoordinator:
                 _LOGGER.debug("Creating %s controller...", self._bed_type)
                 self._controller = await self._async_create_controller()
                 _LOGGER.debug("Controller created successfully")
+                self._connected = True
 
                 if reset_timer:
                     self._reset_disconnect_timer()
@@ -627,6 +637,7 @@ class AdjustableBedCoordinator:
                             type(disconnect_err).__name__,
                         )
                     self._client = None
+                    self._connected = False
                 # Delay is handled at the start of the next iteration with progressive backoff
             except Exception as err:
                 _LOGGER.warning(
@@ -655,6 +666,7 @@ class AdjustableBedCoordinator:
                             type(disconnect_err).__name__,
                         )
                     self._client = None
+                    self._connected = False
                 # Delay is handled at the start of the next iteration with progressive backoff
 
         _LOGGER.error(
@@ -689,8 +701,10 @@ class AdjustableBedCoordinator:
                 self._address,
             )
             self._client = None
+            self._connected = False
             self._controller = None
             self._position_data = {}
+            self._signalled_positions = {}
             # Flag is reset in async_disconnect's finally block
             return
 
@@ -705,15 +719,17 @@ class AdjustableBedCoordinator:
             self._address,
         )
         self._client = None
+        self._connected = False
         self._controller = None
         self._position_data = {}  # Clear stale position data
+        self._signalled_positions = {}
         self._cancel_disconnect_timer()
         _LOGGER.debug("Disconnect cleanup complete for %s", self._address)
 
         # Schedule automatic reconnection attempt
         self._reconnect_timer = self.hass.loop.call_later(
             5.0,  # Wait 5 seconds before attempting reconnect
-            lambda: asyncio.create_task(self._async_auto_reconnect()),
+            lambda: self.hass.async_create_task(self._async_auto_reconnect(), eager_start=True),
         )
 
     async def _async_create_controller(self) -> BedController:
@@ -824,7 +840,7 @@ class AdjustableBedCoordinator:
         self._reconnect_timer = None
 
         # Don't reconnect if we're already connected or connecting
-        if self._connecting or (self._client is not None and self._client.is_connected):
+        if self._connecting or self._connected:
             _LOGGER.debug("Skipping auto-reconnect: already connected or connecting")
             return
 
@@ -851,6 +867,7 @@ class AdjustableBedCoordinator:
         _LOGGER.debug("async_disconnect called for %s", self._address)
         async with self._lock:
             self._cancel_disconnect_timer()
+            self._flush_position_updates()
             # Cancel any pending reconnect timer
             if self._reconnect_timer is not None:
                 self._reconnect_timer.cancel()
@@ -866,6 +883,7 @@ class AdjustableBedCoordinator:
                     _LOGGER.debug("Error during disconnect from %s: %s", self._address, err)
                 finally:
                     self._client = None
+                    self._connected = False
                     self._controller = None
                     # Clear flag after disconnect completes - _on_disconnect may or may not fire
                     # depending on BLE backend, so we clear it here as well
@@ -883,7 +901,7 @@ class AdjustableBedCoordinator:
         )
         self._disconnect_timer = self.hass.loop.call_later(
             timeout,
-            lambda: asyncio.create_task(self._async_idle_disconnect()),
+            lambda: self.hass.async_create_task(self._async_idle_disconnect(), eager_start=True),
         )
 
     def _cancel_disconnect_timer(self) -> None:
@@ -906,7 +924,7 @@ class AdjustableBedCoordinator:
     async def async_ensure_connected(self, reset_timer: bool = True) -> bool:
         """Ensure we are connected to the bed."""
         async with self._lock:
-            if self._client is not None and self._client.is_connected:
+            if self._connected:
                 _LOGGER.debug("Connection check: already connected to %s", self._address)
                 if reset_timer:
                     self._reset_disconnect_timer()
@@ -959,7 +977,7 @@ class AdjustableBedCoordinator:
                 if not self._disable_angle_sensing and not self._cancel_command.is_set():
                     await self._async_read_positions()
             finally:
-                if self._client is not None and self._client.is_connected:
+                if self._connected:
                     self._reset_disconnect_timer()
 
     async def async_stop_command(self) -> None:
@@ -987,7 +1005,7 @@ class AdjustableBedCoordinator:
                 await self._controller.stop_all()
                 _LOGGER.info("Stop command sent")
             finally:
-                if self._client is not None and self._client.is_connected:
+                if self._connected:
                     self._reset_disconnect_timer()
 
     async def async_execute_controller_command(
@@ -1029,7 +1047,7 @@ class AdjustableBedCoordinator:
                 if not self._disable_angle_sensing and not self._cancel_command.is_set():
                     await self._async_read_positions()
             finally:
-                if self._client is not None and self._client.is_connected:
+                if self._connected:
                     self._reset_disconnect_timer()
 
     async def async_start_notify(self) -> None:
@@ -1060,26 +1078,44 @@ class AdjustableBedCoordinator:
             await self._controller.read_positions(self._motor_count)
         except Exception as err:
             _LOGGER.debug("Failed to read positions: %s", err)
+        # Movement has finished, publish the final positions without waiting
+        self._flush_position_updates()
 
     @callback
     def _handle_position_update(self, position: str, angle: float) -> None:
-        """Handle a position update from the bed."""
+        """Handle a position update from the bed.
+
+        Beds send bursts of notifications while motors move, so changed
+        positions are collected and signalled together once the debounce
+        window has passed.
+        """
+        if self._position_data.get(position) == angle:
+            return
         _LOGGER.debug("Position update: %s = %.1f°", position, angle)
         self._position_data[position] = angle
-        # Copy to safely iterate while callbacks might unregister themselves
-        for callback_fn in list(self._position_callbacks):
-            try:
-                callback_fn(self._position_data)
-            except Exception as err:
-                _LOGGER.warning("Position callback error: %s", err)
-
-    def register_position_callback(
-        self, callback_fn: Callable[[dict[str, float]], None]
-    ) -> Callable[[], None]:
-        """Register a callback for position updates."""
-        self._position_callbacks.add(callback_fn)
+        self._pending_positions.add(position)
+        if self._position_flush_timer is None:
+            self._position_flush_timer = self.hass.loop.call_later(
+                POSITION_UPDATE_DEBOUNCE, self._flush_position_updates
+            )
 
-        def unregister() -> None:
-            self._position_callbacks.discard(callback_fn)  # Safe removal, no error if missing
+    @callback
+    def _flush_position_updates(self) -> None:
+        """Signal listeners of every position that changed since the last flush.
 
-        return unregister
+        Positions that moved and came back to the last signalled value within
+        the debounce window are skipped.
+        """
+        if self._position_flush_timer is not None:
+            self._position_flush_timer.cancel()
+            self._position_flush_timer = None
+        pending, self._pending_positions = self._pending_positions, set()
+        for position in pending:
+            angle = self._position_data.get(position)
+            if angle is None or self._signalled_positions.get(position) == angle:
+                continue
+            self._signalled_positions[position] = angle
+            async_dispatcher_send(self.hass, SIGNAL_POSITION_UPDATE.format(self._address, position))
+
+
+AdjustableBedConfigEntry = ConfigEntry[AdjustableBedCoordinator]
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Coroutine
+from operator import methodcaller
+from typing import Any
 
 from homeassistant.components.cover import (
     CoverDeviceClass,
@@ -12,27 +13,32 @@ from homeassistant.components.cover import (
     CoverEntityDescription,
     CoverEntityFeature,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT, DOMAIN
-from .coordinator import AdjustableBedCoordinator
+from .const import CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT
+from .coordinator import AdjustableBedConfigEntry, AdjustableBedCoordinator
 from .entity import AdjustableBedEntity
 
-if TYPE_CHECKING:
-    from .beds.base import BedController
-
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum motor angles used to normalize positions to a percentage
+_MAX_ANGLES: dict[str, int] = {
+    "back": 68,
+    "legs": 45,
+    "head": 68,
+    "feet": 45,
+}
+
 
 @dataclass(frozen=True, kw_only=True)
 class AdjustableBedCoverEntityDescription(CoverEntityDescription):
     """Describes a Adjustable Bed cover entity."""
 
-    open_fn: Callable[[BedController], Coroutine[Any, Any, None]]
-    close_fn: Callable[[BedController], Coroutine[Any, Any, None]]
-    stop_fn: Callable[[BedController], Coroutine[Any, Any, None]]
+    # Names of the BedController methods driving this motor
+    open_action: str
+    close_action: str
+    stop_action: str
     min_motors: int = 2
 
 
@@ -46,9 +52,9 @@ COVER_DESCRIPTIONS: tuple[AdjustableBedCoverEntityDescription, ...] = (
         translation_key="back",
         icon="mdi:human-handsup",
         device_class=CoverDeviceClass.DAMPER,
-        open_fn=lambda ctrl: ctrl.move_back_up(),
-        close_fn=lambda ctrl: ctrl.move_back_down(),
-        stop_fn=lambda ctrl: ctrl.move_back_stop(),
+        open_action="move_back_up",
+        close_action="move_back_down",
+        stop_action="move_back_stop",
         min_motors=2,
     ),
     AdjustableBedCoverEntityDescription(
@@ -56,9 +62,9 @@ COVER_DESCRIPTIONS: tuple[AdjustableBedCoverEntityDescription, ...] = (
         translation_key="legs",
         icon="mdi:human-handsdown",
         device_class=CoverDeviceClass.DAMPER,
-        open_fn=lambda ctrl: ctrl.move_legs_up(),
-        close_fn=lambda ctrl: ctrl.move_legs_down(),
-        stop_fn=lambda ctrl: ctrl.move_legs_stop(),
+        open_action="move_legs_up",
+        close_action="move_legs_down",
+        stop_action="move_legs_stop",
         min_motors=2,
     ),
     AdjustableBedCoverEntityDescription(
@@ -66,9 +72,9 @@ COVER_DESCRIPTIONS: tuple[AdjustableBedCoverEntityDescription, ...] = (
         translation_key="head",
         icon="mdi:head",
         device_class=CoverDeviceClass.DAMPER,
-        open_fn=lambda ctrl: ctrl.move_head_up(),
-        close_fn=lambda ctrl: ctrl.move_head_down(),
-        stop_fn=lambda ctrl: ctrl.move_head_stop(),
+        open_action="move_head_up",
+        close_action="move_head_down",
+        stop_action="move_head_stop",
         min_motors=3,
     ),
     AdjustableBedCoverEntityDescription(
@@ -76,29 +82,33 @@ COVER_DESCRIPTIONS: tuple[AdjustableBedCoverEntityDescription, ...] = (
         translation_key="feet",
         icon="mdi:foot-print",
         device_class=CoverDeviceClass.DAMPER,
-        open_fn=lambda ctrl: ctrl.move_feet_up(),
-        close_fn=lambda ctrl: ctrl.move_feet_down(),
-        stop_fn=lambda ctrl: ctrl.move_feet_stop(),
+        open_action="move_feet_up",
+        close_action="move_feet_down",
+        stop_action="move_feet_stop",
         min_motors=4,
     ),
 )
 
+# Cover descriptions that apply to each supported motor count
+_DESCRIPTIONS_BY_MOTOR_COUNT: dict[int, tuple[AdjustableBedCoverEntityDescription, ...]] = {
+    motor_count: tuple(d for d in COVER_DESCRIPTIONS if d.min_motors <= motor_count)
+    for motor_count in (2, 3, 4)
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: AdjustableBedConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Adjustable Bed cover entities."""
-    coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     motor_count = entry.data.get(CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT)
 
-    entities = []
-    for description in COVER_DESCRIPTIONS:
-        if motor_count >= description.min_motors:
-            entities.append(AdjustableBedCover(coordinator, description))
-
-    async_add_entities(entities)
+    async_add_entities(
+        AdjustableBedCover(coordinator, description)
+        for description in _DESCRIPTIONS_BY_MOTOR_COUNT[motor_count]
+    )
 
 
 class AdjustableBedCover(AdjustableBedEntity, CoverEntity):
@@ -115,11 +125,10 @@ class AdjustableBedCover(AdjustableBedEntity, CoverEntity):
         description: AdjustableBedCoverEntityDescription,
     ) -> None:
         """Initialize the cover."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{coordinator.address}_{description.key}"
+        super().__init__(coordinator, description)
         self._is_moving = False
         self._move_direction: str | None = None
+        self._max_angle_recip = 100.0 / _MAX_ANGLES.get(description.key, 68)
 
     @property
     def is_closed(self) -> bool | None:
@@ -150,15 +159,7 @@ class AdjustableBedCover(AdjustableBedEntity, CoverEntity):
             return None
 
         # Convert angle to percentage (0-100)
-        # Max angles vary by motor type, but we'll normalize
-        max_angles = {
-            "back": 68,
-            "legs": 45,
-            "head": 68,
-            "feet": 45,
-        }
-        max_angle = max_angles.get(self.entity_description.key, 68)
-        return min(100, int((angle / max_angle) * 100))
+        return int(min(100.0, angle * self._max_angle_recip))
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover (raise the motor)."""
@@ -191,14 +192,12 @@ class AdjustableBedCover(AdjustableBedEntity, CoverEntity):
                 direction,
                 self.entity_description.key,
             )
-            if direction == "open":
-                await self._coordinator.async_execute_controller_command(
-                    self.entity_description.open_fn
-                )
-            else:
-                await self._coordinator.async_execute_controller_command(
-                    self.entity_description.close_fn
-                )
+            action = (
+                self.entity_description.open_action
+                if direction == "open"
+                else self.entity_description.close_action
+            )
+            await self._coordinator.async_execute_controller_command(methodcaller(action))
             _LOGGER.debug(
                 "Movement command sent for %s %s",
                 self.entity_description.key,
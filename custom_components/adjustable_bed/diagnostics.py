@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
 from homeassistant.core import HomeAssistant
 
@@ -16,19 +15,18 @@ from .const import (
     CONF_MOTOR_COUNT,
     CONF_PREFERRED_ADAPTER,
     CONF_PROTOCOL_VARIANT,
-    DOMAIN,
 )
-from .coordinator import AdjustableBedCoordinator
+from .coordinator import AdjustableBedConfigEntry
 
 # Keys to redact from diagnostics (privacy-sensitive data)
 TO_REDACT = {CONF_ADDRESS, CONF_NAME, "address"}
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: AdjustableBedConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     # Get connection state
     is_connected = coordinator.is_connected
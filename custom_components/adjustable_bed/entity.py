@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import Entity, EntityDescription
 
 from .const import DOMAIN
 
@@ -17,18 +17,16 @@ class AdjustableBedEntity(Entity):
     """Base class for Adjustable Bed entities."""
 
     _attr_has_entity_name = True
+    # Entities are always available as long as the integration is loaded.
+    # We connect on-demand when commands are sent.
+    _attr_available = True
 
-    def __init__(self, coordinator: AdjustableBedCoordinator) -> None:
+    def __init__(
+        self, coordinator: AdjustableBedCoordinator, description: EntityDescription
+    ) -> None:
         """Initialize the entity."""
         self._coordinator = coordinator
+        self.entity_description = description
         self._attr_device_info = coordinator.device_info
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available.
-
-        Entities are always available as long as the integration is loaded.
-        We connect on-demand when commands are sent.
-        """
-        return True
+        self._attr_unique_id = f"{coordinator.address}_{description.key}"
 
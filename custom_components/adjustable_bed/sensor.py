@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Callable
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,20 +11,18 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import DEGREE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT, DOMAIN
-from .coordinator import AdjustableBedCoordinator
+from .const import CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT, SIGNAL_POSITION_UPDATE
+from .coordinator import AdjustableBedConfigEntry
 from .entity import AdjustableBedEntity
 
 _LOGGER = logging.getLogger(__name__)
 
-# Unit constant for angle measurements
-UNIT_DEGREES = "°"
-
 
 @dataclass(frozen=True, kw_only=True)
 class AdjustableBedSensorEntityDescription(SensorEntityDescription):
@@ -35,57 +32,45 @@ class AdjustableBedSensorEntityDescription(SensorEntityDescription):
     min_motors: int = 2
 
 
-SENSOR_DESCRIPTIONS: tuple[AdjustableBedSensorEntityDescription, ...] = (
-    AdjustableBedSensorEntityDescription(
-        key="back_angle",
-        translation_key="back_angle",
-        icon="mdi:angle-acute",
-        native_unit_of_measurement=UNIT_DEGREES,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        position_key="back",
-        min_motors=2,
-    ),
-    AdjustableBedSensorEntityDescription(
-        key="legs_angle",
-        translation_key="legs_angle",
-        icon="mdi:angle-acute",
-        native_unit_of_measurement=UNIT_DEGREES,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        position_key="legs",
-        min_motors=2,
-    ),
-    AdjustableBedSensorEntityDescription(
-        key="head_angle",
-        translation_key="head_angle",
-        icon="mdi:angle-acute",
-        native_unit_of_measurement=UNIT_DEGREES,
-        state_class=SensorStateClass.MEASUREMENT,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        position_key="head",
-        min_motors=3,
-    ),
+# (position key, minimum motor count) for each angle sensor
+# - 2 motors: back and legs
+# - 3 motors: back, legs, head
+# - 4 motors: back, legs, head, feet
+_ANGLE_SENSORS: tuple[tuple[str, int], ...] = (
+    ("back", 2),
+    ("legs", 2),
+    ("head", 3),
+    ("feet", 4),
+)
+
+SENSOR_DESCRIPTIONS: tuple[AdjustableBedSensorEntityDescription, ...] = tuple(
     AdjustableBedSensorEntityDescription(
-        key="feet_angle",
-        translation_key="feet_angle",
+        key=f"{position_key}_angle",
+        translation_key=f"{position_key}_angle",
         icon="mdi:angle-acute",
-        native_unit_of_measurement=UNIT_DEGREES,
+        native_unit_of_measurement=DEGREE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        position_key="feet",
-        min_motors=4,
-    ),
+        position_key=position_key,
+        min_motors=min_motors,
+    )
+    for position_key, min_motors in _ANGLE_SENSORS
 )
 
+# Sensor descriptions that apply to each supported motor count
+_DESCRIPTIONS_BY_MOTOR_COUNT: dict[int, tuple[AdjustableBedSensorEntityDescription, ...]] = {
+    motor_count: tuple(d for d in SENSOR_DESCRIPTIONS if d.min_motors <= motor_count)
+    for motor_count in (2, 3, 4)
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: AdjustableBedConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Adjustable Bed sensor entities."""
-    coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     motor_count = entry.data.get(CONF_MOTOR_COUNT, DEFAULT_MOTOR_COUNT)
 
     # Skip angle sensors if angle sensing is disabled
@@ -93,12 +78,10 @@ async def async_setup_entry(
         _LOGGER.debug("Angle sensing disabled, skipping angle sensor creation")
         return
 
-    entities = []
-    for description in SENSOR_DESCRIPTIONS:
-        if motor_count >= description.min_motors:
-            entities.append(AdjustableBedAngleSensor(coordinator, description))
-
-    async_add_entities(entities)
+    async_add_entities(
+        AdjustableBedAngleSensor(coordinator, description)
+        for description in _DESCRIPTIONS_BY_MOTOR_COUNT[motor_count]
+    )
 
 
 class AdjustableBedAngleSensor(AdjustableBedEntity, SensorEntity):
@@ -106,35 +89,19 @@ class AdjustableBedAngleSensor(AdjustableBedEntity, SensorEntity):
 
     entity_description: AdjustableBedSensorEntityDescription
 
-    def __init__(
-        self,
-        coordinator: AdjustableBedCoordinator,
-        description: AdjustableBedSensorEntityDescription,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{coordinator.address}_{description.key}"
-        self._unregister_callback: Callable[[], None] | None = None
-
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
-        self._unregister_callback = self._coordinator.register_position_callback(
-            self._handle_position_update
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_POSITION_UPDATE.format(
+                    self._coordinator.address, self.entity_description.position_key
+                ),
+                self.async_write_ha_state,
+            )
         )
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity is removed from hass."""
-        if self._unregister_callback:
-            self._unregister_callback()
-        await super().async_will_remove_from_hass()
-
-    @callback
-    def _handle_position_update(self, position_data: dict[str, float]) -> None:
-        """Handle position data update."""
-        self.async_write_ha_state()
-
     @property
     def native_value(self) -> float | None:
         """Return the sensor value."""
@@ -4,20 +4,16 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Coroutine
+from operator import methodcaller
+from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
-from .coordinator import AdjustableBedCoordinator
+from .coordinator import AdjustableBedConfigEntry, AdjustableBedCoordinator
 from .entity import AdjustableBedEntity
 
-if TYPE_CHECKING:
-    from .beds.base import BedController
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,8 +21,9 @@ _LOGGER = logging.getLogger(__name__)
 class AdjustableBedSwitchEntityDescription(SwitchEntityDescription):
     """Describes a Adjustable Bed switch entity."""
 
-    turn_on_fn: Callable[[BedController], Coroutine[Any, Any, None]]
-    turn_off_fn: Callable[[BedController], Coroutine[Any, Any, None]]
+    # Names of the BedController methods switching this feature
+    turn_on_action: str
+    turn_off_action: str
 
 
 SWITCH_DESCRIPTIONS: tuple[AdjustableBedSwitchEntityDescription, ...] = (
@@ -34,19 +31,19 @@ SWITCH_DESCRIPTIONS: tuple[AdjustableBedSwitchEntityDescription, ...] = (
         key="under_bed_lights",
         translation_key="under_bed_lights",
         icon="mdi:lightbulb",
-        turn_on_fn=lambda ctrl: ctrl.lights_on(),
-        turn_off_fn=lambda ctrl: ctrl.lights_off(),
+        turn_on_action="lights_on",
+        turn_off_action="lights_off",
     ),
 )
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: AdjustableBedConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Adjustable Bed switch entities."""
-    coordinator: AdjustableBedCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities = [
         AdjustableBedSwitch(coordinator, description)
@@ -67,65 +64,38 @@ class AdjustableBedSwitch(AdjustableBedEntity, SwitchEntity):
         description: AdjustableBedSwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{coordinator.address}_{description.key}"
+        super().__init__(coordinator, description)
         self._attr_is_on = False  # We don't have state feedback
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        _LOGGER.info(
-            "Switch turn on: %s (device: %s)",
-            self.entity_description.key,
-            self._coordinator.name,
-        )
-
-        try:
-            _LOGGER.debug("Sending turn on command for %s", self.entity_description.key)
-            await self._coordinator.async_execute_controller_command(
-                self.entity_description.turn_on_fn,
-                cancel_running=False,
-            )
-            self._attr_is_on = True
-            self.async_write_ha_state()
-            _LOGGER.debug("Switch %s turned on successfully", self.entity_description.key)
-        except NotImplementedError:
-            _LOGGER.warning(
-                "This bed does not support %s feature",
-                self.entity_description.key,
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to turn on switch %s: %s",
-                self.entity_description.key,
-                err,
-            )
+        await self._async_set(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        _LOGGER.info(
-            "Switch turn off: %s (device: %s)",
-            self.entity_description.key,
-            self._coordinator.name,
-        )
+        await self._async_set(False)
+
+    async def _async_set(self, is_on: bool) -> None:
+        """Send the turn on/off command and update the optimistic state."""
+        coordinator = self._coordinator
+        description = self.entity_description
+        key = description.key
+        verb = "on" if is_on else "off"
+        _LOGGER.info("Switch turn %s: %s (device: %s)", verb, key, coordinator.name)
 
         try:
-            _LOGGER.debug("Sending turn off command for %s", self.entity_description.key)
-            await self._coordinator.async_execute_controller_command(
-                self.entity_description.turn_off_fn,
-                cancel_running=False,
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Sending turn %s command for %s", verb, key)
+            action = description.turn_on_action if is_on else description.turn_off_action
+            await coordinator.async_execute_controller_command(
+                methodcaller(action), cancel_running=False
             )
-            self._attr_is_on = False
-            self.async_write_ha_state()
-            _LOGGER.debug("Switch %s turned off successfully", self.entity_description.key)
+            # The command is always sent, but the optimistic state only needs
+            # writing when it actually changes
+            if self._attr_is_on != is_on:
+                self._attr_is_on = is_on
+                self.async_write_ha_state()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Switch %s turned %s successfully", key, verb)
         except NotImplementedError:
-            _LOGGER.warning(
-                "This bed does not support %s feature",
-                self.entity_description.key,
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to turn off switch %s: %s",
-                self.entity_description.key,
-                err,
-            )
+            _LOGGER.warning("This bed does not support %s feature", key)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+import asyncio
+from collections.abc import Callable, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -80,27 +81,103 @@ def mock_config_entry(hass: HomeAssistant, mock_config_entry_data: dict) -> Mock
 
 
 @pytest.fixture
-def mock_bleak_client() -> MagicMock:
-    """Mock BleakClient."""
-    from bleak import BleakClient
+def make_entry(
+    hass: HomeAssistant, mock_config_entry_data: dict
+) -> Callable[..., MockConfigEntry]:
+    """Return a factory for extra config entries for other beds."""
 
-    client = MagicMock(spec=BleakClient)
-    client.is_connected = True
-    client.address = TEST_ADDRESS
-    client.mtu_size = 23
-    client.services = MagicMock()
-    client.services.__iter__ = lambda self: iter([])
-    client.services.__len__ = lambda self: 0
-    # Return None for service lookups to avoid false positives in variant detection
-    client.services.get_service = MagicMock(return_value=None)
+    def _make(address: str, entry_id: str, title: str = TEST_NAME) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=title,
+            data={**mock_config_entry_data, CONF_ADDRESS: address},
+            unique_id=address,
+            entry_id=entry_id,
+        )
+        entry.add_to_hass(hass)
+        return entry
 
-    client.connect = AsyncMock(return_value=True)
-    client.disconnect = AsyncMock()
-    client.write_gatt_char = AsyncMock()
-    client.start_notify = AsyncMock()
-    client.stop_notify = AsyncMock()
+    return _make
 
-    return client
+
+class FakeBleakServices:
+    """Empty BLE service collection."""
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def get_service(self, specifier):
+        # Return None for service lookups to avoid false positives in variant detection
+        return None
+
+
+class FakeBleakClient:
+    """Lightweight stand-in for BleakClient.
+
+    Only the calls tests assert on are mocks; everything else is a plain
+    attribute or coroutine.
+    """
+
+    def __init__(self) -> None:
+        self.services = FakeBleakServices()
+        self.disconnect = AsyncMock()
+        self.write_gatt_char = AsyncMock()
+        self.start_notify = AsyncMock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the state a test expects from a freshly connected client."""
+        self.is_connected = True
+        self.address = TEST_ADDRESS
+        self.mtu_size = 23
+        for mock in (self.disconnect, self.write_gatt_char, self.start_notify):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    async def connect(self, **kwargs) -> bool:
+        return True
+
+    async def stop_notify(self, char_specifier) -> None:
+        return None
+
+    async def read_gatt_char(self, char_specifier, **kwargs) -> bytearray:
+        return bytearray()
+
+
+def first_write_data(client: FakeBleakClient) -> bytes:
+    """Return the data of the first GATT write sent through the fake client."""
+    return client.write_gatt_char.call_args_list[0].args[1]
+
+
+def assert_last_write(
+    client: FakeBleakClient, char_specifier, data: bytes, *, response: bool
+) -> None:
+    """Assert the last GATT write sent through the fake client."""
+    last = client.write_gatt_char.call_args
+    assert last is not None, "No GATT write was sent"
+    assert (last.args, last.kwargs) == ((char_specifier, data), {"response": response})
+
+
+def assert_no_writes(client: FakeBleakClient) -> None:
+    """Assert no GATT write was sent through the fake client."""
+    assert not client.write_gatt_char.called, (
+        f"Unexpected GATT writes: {client.write_gatt_char.call_args_list}"
+    )
+
+
+@pytest.fixture(scope="module")
+def _shared_bleak_client() -> FakeBleakClient:
+    """Build the BleakClient stand-in once per test module."""
+    return FakeBleakClient()
+
+
+@pytest.fixture
+def mock_bleak_client(_shared_bleak_client: FakeBleakClient) -> FakeBleakClient:
+    """Mock BleakClient, reset to a clean connected state for each test."""
+    _shared_bleak_client.reset()
+    return _shared_bleak_client
 
 
 @pytest.fixture
@@ -294,7 +371,7 @@ def mock_bluetooth_service_info_okimat() -> MagicMock:
 
 
 @pytest.fixture
-def mock_establish_connection(mock_bleak_client: MagicMock) -> Generator[AsyncMock, None, None]:
+def mock_establish_connection(mock_bleak_client: FakeBleakClient) -> Generator[AsyncMock, None, None]:
     """Mock bleak_retry_connector.establish_connection."""
     with patch(
         "custom_components.adjustable_bed.coordinator.establish_connection",
@@ -349,6 +426,23 @@ def mock_bluetooth_adapters() -> Generator[None, None, None]:
             p.stop()
 
 
+@pytest.fixture
+def fast_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip the delays between repeated bed commands.
+
+    Patches asyncio.sleep itself, so every sleep in the process returns
+    immediately for the duration of the test, not just the controllers'.
+    It still yields to the event loop once per sleep so the task
+    interleaving stays the same.
+    """
+    real_sleep = asyncio.sleep
+
+    async def _no_delay(delay: float, result=None):
+        return await real_sleep(0, result)
+
+    monkeypatch.setattr(asyncio, "sleep", _no_delay)
+
+
 @pytest.fixture
 def mock_coordinator_connected(
     mock_establish_connection: AsyncMock,
@@ -0,0 +1,72 @@
+"""Tests for Jiecang and Linak command constants."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.adjustable_bed.beds.jiecang import JiecangCommands
+from custom_components.adjustable_bed.beds.linak import LinakCommands
+
+_JIECANG_COMMANDS: dict[str, bytes] = {
+    "MEMORY_1": bytes.fromhex("f1f10b01010d7e"),
+    "MEMORY_2": bytes.fromhex("f1f10d01010f7e"),
+    "FLAT": bytes.fromhex("f1f10801010a7e"),
+    "ZERO_G": bytes.fromhex("f1f1070101097e"),
+}
+_LINAK_COMMANDS: dict[str, bytes] = {
+    # Preset memory
+    "PRESET_MEMORY_1": bytes([0x0E, 0x00]),
+    "PRESET_MEMORY_2": bytes([0x0F, 0x00]),
+    "PRESET_MEMORY_3": bytes([0x0C, 0x00]),
+    "PRESET_MEMORY_4": bytes([0x44, 0x00]),
+    # Program memory
+    "PROGRAM_MEMORY_1": bytes([0x38, 0x00]),
+    "PROGRAM_MEMORY_2": bytes([0x39, 0x00]),
+    "PROGRAM_MEMORY_3": bytes([0x3A, 0x00]),
+    "PROGRAM_MEMORY_4": bytes([0x45, 0x00]),
+    # Movement
+    "MOVE_STOP": bytes([0x00, 0x00]),
+    "MOVE_HEAD_UP": bytes([0x03, 0x00]),
+    "MOVE_HEAD_DOWN": bytes([0x02, 0x00]),
+    "MOVE_LEGS_UP": bytes([0x09, 0x00]),
+    "MOVE_LEGS_DOWN": bytes([0x08, 0x00]),
+    # Lights
+    "LIGHTS_ON": bytes([0x92, 0x00]),
+    "LIGHTS_OFF": bytes([0x93, 0x00]),
+    "LIGHTS_TOGGLE": bytes([0x94, 0x00]),
+    # Massage
+    "MASSAGE_ALL_OFF": bytes([0x80, 0x00]),
+    "MASSAGE_ALL_TOGGLE": bytes([0x91, 0x00]),
+    "MASSAGE_HEAD_TOGGLE": bytes([0xA6, 0x00]),
+    "MASSAGE_FOOT_TOGGLE": bytes([0xA7, 0x00]),
+}
+
+
+class TestJiecangCommands:
+    """Test Jiecang command constants."""
+
+    @pytest.mark.parametrize(
+        "attr,expected", list(_JIECANG_COMMANDS.items()), ids=list(_JIECANG_COMMANDS)
+    )
+    def test_preset_commands(self, attr: str, expected: bytes):
+        """Test preset commands are correct."""
+        assert getattr(JiecangCommands, attr) == expected
+
+    @pytest.mark.parametrize("attr", list(_JIECANG_COMMANDS))
+    def test_command_shape(self, attr: str):
+        """Test commands are 7 bytes framed by 0xf1f1 and 0x7e."""
+        cmd = getattr(JiecangCommands, attr)
+        assert len(cmd) == 7, f"Command {cmd.hex()} should be 7 bytes"
+        assert cmd[:2] == bytes([0xF1, 0xF1]), f"Command {cmd.hex()} should start with f1f1"
+        assert cmd[-1] == 0x7E, f"Command {cmd.hex()} should end with 7e"
+
+
+class TestLinakCommands:
+    """Test Linak command constants."""
+
+    @pytest.mark.parametrize(
+        "attr,expected", list(_LINAK_COMMANDS.items()), ids=list(_LINAK_COMMANDS)
+    )
+    def test_command(self, attr: str, expected: bytes):
+        """Test command constants are correct."""
+        assert getattr(LinakCommands, attr) == expected
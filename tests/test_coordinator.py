@@ -6,7 +6,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from bleak.exc import BleakError
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from custom_components.adjustable_bed.const import (
     BED_MOTOR_PULSE_DEFAULTS,
@@ -20,10 +21,11 @@ from custom_components.adjustable_bed.const import (
     DEFAULT_MOTOR_PULSE_COUNT,
     DEFAULT_MOTOR_PULSE_DELAY_MS,
     DOMAIN,
+    SIGNAL_POSITION_UPDATE,
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
-from .conftest import TEST_ADDRESS, TEST_NAME
+from .conftest import TEST_ADDRESS, TEST_NAME, FakeBleakClient
 
 
 class TestCoordinatorInit:
@@ -59,6 +61,7 @@ class TestCoordinatorInit:
         assert device_info["name"] == TEST_NAME
         assert device_info["manufacturer"] == "Linak"
         assert "2 motors" in device_info["model"]
+        assert coordinator.device_info is device_info
 
 
 class TestCoordinatorConnection:
@@ -69,7 +72,7 @@ class TestCoordinatorConnection:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test successful connection."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
@@ -77,6 +80,7 @@ class TestCoordinatorConnection:
 
         assert result is True
         assert coordinator.controller is not None
+        assert coordinator.is_connected is True
 
     async def test_connect_device_not_found(
         self,
@@ -118,7 +122,7 @@ class TestCoordinatorConnection:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test disconnection."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
@@ -127,13 +131,14 @@ class TestCoordinatorConnection:
         await coordinator.async_disconnect()
 
         mock_bleak_client.disconnect.assert_called_once()
+        assert coordinator.is_connected is False
 
     async def test_ensure_connected_when_connected(
         self,
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test ensure_connected returns True when already connected."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
@@ -148,7 +153,7 @@ class TestCoordinatorConnection:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test ensure_connected reconnects when disconnected."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
@@ -159,56 +164,105 @@ class TestCoordinatorConnection:
         assert result is True
 
 
-class TestCoordinatorPositionCallbacks:
-    """Test coordinator position callback handling."""
+class TestCoordinatorPositionUpdates:
+    """Test coordinator position update dispatching."""
 
-    async def test_register_position_callback(
+    async def test_position_update_signals_only_changed_position(
         self,
         hass: HomeAssistant,
         mock_config_entry,
     ):
-        """Test registering position callbacks."""
+        """Test position updates are only signalled to listeners of that position."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
-        callback = MagicMock()
+        back_listener = callback(MagicMock())
+        legs_listener = callback(MagicMock())
 
-        unregister = coordinator.register_position_callback(callback)
+        async_dispatcher_connect(
+            hass, SIGNAL_POSITION_UPDATE.format(TEST_ADDRESS, "back"), back_listener
+        )
+        async_dispatcher_connect(
+            hass, SIGNAL_POSITION_UPDATE.format(TEST_ADDRESS, "legs"), legs_listener
+        )
 
-        assert callback in coordinator._position_callbacks
-        assert callable(unregister)
+        # Simulate position update
+        coordinator._handle_position_update("back", 45.0)
+        coordinator._flush_position_updates()
+        await hass.async_block_till_done()
 
-    async def test_unregister_position_callback(
+        assert coordinator.position_data["back"] == 45.0
+        back_listener.assert_called_once_with()
+        legs_listener.assert_not_called()
+
+    async def test_unchanged_position_not_signalled(
         self,
         hass: HomeAssistant,
         mock_config_entry,
     ):
-        """Test unregistering position callbacks."""
+        """Test repeated identical position updates are only signalled once."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
-        callback = MagicMock()
+        listener = callback(MagicMock())
 
-        unregister = coordinator.register_position_callback(callback)
-        unregister()
+        async_dispatcher_connect(
+            hass, SIGNAL_POSITION_UPDATE.format(TEST_ADDRESS, "back"), listener
+        )
 
-        assert callback not in coordinator._position_callbacks
+        coordinator._handle_position_update("back", 45.0)
+        coordinator._flush_position_updates()
+        coordinator._handle_position_update("back", 45.0)
+        await hass.async_block_till_done()
+
+        listener.assert_called_once_with()
+        assert coordinator._position_flush_timer is None
 
-    async def test_position_update_triggers_callbacks(
+    async def test_position_updates_coalesced(
         self,
         hass: HomeAssistant,
         mock_config_entry,
     ):
-        """Test position updates trigger all callbacks."""
+        """Test a burst of position updates is signalled once per flush."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
-        callback1 = MagicMock()
-        callback2 = MagicMock()
+        listener = callback(MagicMock())
 
-        coordinator.register_position_callback(callback1)
-        coordinator.register_position_callback(callback2)
+        async_dispatcher_connect(
+            hass, SIGNAL_POSITION_UPDATE.format(TEST_ADDRESS, "back"), listener
+        )
 
-        # Simulate position update
+        coordinator._handle_position_update("back", 40.0)
+        coordinator._handle_position_update("back", 42.5)
         coordinator._handle_position_update("back", 45.0)
+        await hass.async_block_till_done()
+
+        listener.assert_not_called()
+        assert coordinator._position_flush_timer is not None
 
+        coordinator._flush_position_updates()
+        await hass.async_block_till_done()
+
+        listener.assert_called_once_with()
         assert coordinator.position_data["back"] == 45.0
-        callback1.assert_called_once_with({"back": 45.0})
-        callback2.assert_called_once_with({"back": 45.0})
+        assert coordinator._position_flush_timer is None
+
+    async def test_position_returning_to_signalled_value_not_signalled(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+    ):
+        """Test a position that changes and changes back before a flush is not signalled."""
+        coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
+        listener = callback(MagicMock())
+
+        async_dispatcher_connect(
+            hass, SIGNAL_POSITION_UPDATE.format(TEST_ADDRESS, "back"), listener
+        )
+
+        coordinator._handle_position_update("back", 45.0)
+        coordinator._flush_position_updates()
+        coordinator._handle_position_update("back", 46.0)
+        coordinator._handle_position_update("back", 45.0)
+        coordinator._flush_position_updates()
+        await hass.async_block_till_done()
+
+        listener.assert_called_once_with()
 
 
 class TestCoordinatorDisconnectTimer:
@@ -231,7 +285,7 @@ class TestCoordinatorDisconnectTimer:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test disconnect timer is cancelled on disconnect."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
@@ -249,7 +303,7 @@ class TestCoordinatorWriteCommand:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing commands succeeds."""
         coordinator = AdjustableBedCoordinator(hass, mock_config_entry)
@@ -289,7 +343,7 @@ class TestCoordinatorNotifications:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test start_notify is skipped when angle sensing is disabled."""
         # Default config has disable_angle_sensing=True
@@ -306,7 +360,7 @@ class TestCoordinatorNotifications:
         hass: HomeAssistant,
         mock_config_entry_data: dict,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test start_notify subscribes to notifications when enabled."""
         from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -26,65 +27,129 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
+# Module-level aliases for the command constants used in the tests below
+_C = DewertOkinCommands
+(
+    FLAT,
+    ZERO_G,
+    TV,
+    QUIET_SLEEP,
+    MEMORY_1,
+    MEMORY_2,
+    HEAD_UP,
+    HEAD_DOWN,
+    FOOT_UP,
+    FOOT_DOWN,
+    STOP,
+    WAVE_MASSAGE,
+    HEAD_MASSAGE,
+    FOOT_MASSAGE,
+    MASSAGE_OFF,
+    UNDERLIGHT,
+) = (
+    _C.FLAT,
+    _C.ZERO_G,
+    _C.TV,
+    _C.QUIET_SLEEP,
+    _C.MEMORY_1,
+    _C.MEMORY_2,
+    _C.HEAD_UP,
+    _C.HEAD_DOWN,
+    _C.FOOT_UP,
+    _C.FOOT_DOWN,
+    _C.STOP,
+    _C.WAVE_MASSAGE,
+    _C.HEAD_MASSAGE,
+    _C.FOOT_MASSAGE,
+    _C.MASSAGE_OFF,
+    _C.UNDERLIGHT,
+)
+
+
+_EXPECTED_PRESETS: dict[str, bytes] = {
+    name: bytes.fromhex(value)
+    for name, value in (
+        ("FLAT", "040210000000"),
+        ("ZERO_G", "040200004000"),
+        ("TV", "040200003000"),
+        ("QUIET_SLEEP", "040200008000"),
+        ("MEMORY_1", "040200001000"),
+        ("MEMORY_2", "040200002000"),
+    )
+}
+_EXPECTED_MOTOR: dict[str, bytes] = {
+    name: bytes.fromhex(value)
+    for name, value in (
+        ("HEAD_UP", "040200000001"),
+        ("HEAD_DOWN", "040200000002"),
+        ("FOOT_UP", "040200000004"),
+        ("FOOT_DOWN", "040200000008"),
+        ("STOP", "040200000000"),
+    )
+}
+_EXPECTED_MASSAGE: dict[str, bytes] = {
+    name: bytes.fromhex(value)
+    for name, value in (
+        ("WAVE_MASSAGE", "040280000000"),
+        ("HEAD_MASSAGE", "040200000800"),
+        ("FOOT_MASSAGE", "040200400000"),
+        ("MASSAGE_OFF", "040202000000"),
+    )
+}
+_EXPECTED_LIGHTS: dict[str, bytes] = {
+    "UNDERLIGHT": bytes.fromhex("040200020000"),
+}
+_EXPECTED_COMMANDS: dict[str, bytes] = {
+    **_EXPECTED_PRESETS,
+    **_EXPECTED_MOTOR,
+    **_EXPECTED_MASSAGE,
+    **_EXPECTED_LIGHTS,
+}
+
+
+def _last_write(client) -> bytes:
+    """Return the data of the last write to the mocked client."""
+    return client.write_gatt_char.call_args.args[1]
+
 
 class TestDewertOkinCommands:
     """Test DewertOkin command constants."""
 
-    def test_preset_commands(self):
+    @pytest.mark.parametrize("name,expected", list(_EXPECTED_PRESETS.items()))
+    def test_preset_commands(self, name: str, expected: bytes):
         """Test preset commands are correct."""
-        assert DewertOkinCommands.FLAT == bytes.fromhex("040210000000")
-        assert DewertOkinCommands.ZERO_G == bytes.fromhex("040200004000")
-        assert DewertOkinCommands.TV == bytes.fromhex("040200003000")
-        assert DewertOkinCommands.QUIET_SLEEP == bytes.fromhex("040200008000")
-        assert DewertOkinCommands.MEMORY_1 == bytes.fromhex("040200001000")
-        assert DewertOkinCommands.MEMORY_2 == bytes.fromhex("040200002000")
-
-    def test_motor_commands(self):
+        assert getattr(DewertOkinCommands, name) == expected
+
+    @pytest.mark.parametrize("name,expected", list(_EXPECTED_MOTOR.items()))
+    def test_motor_commands(self, name: str, expected: bytes):
         """Test motor movement commands are correct."""
-        assert DewertOkinCommands.HEAD_UP == bytes.fromhex("040200000001")
-        assert DewertOkinCommands.HEAD_DOWN == bytes.fromhex("040200000002")
-        assert DewertOkinCommands.FOOT_UP == bytes.fromhex("040200000004")
-        assert DewertOkinCommands.FOOT_DOWN == bytes.fromhex("040200000008")
-        assert DewertOkinCommands.STOP == bytes.fromhex("040200000000")
+        assert getattr(DewertOkinCommands, name) == expected
 
-    def test_massage_commands(self):
+    @pytest.mark.parametrize("name,expected", list(_EXPECTED_MASSAGE.items()))
+    def test_massage_commands(self, name: str, expected: bytes):
         """Test massage commands are correct."""
-        assert DewertOkinCommands.WAVE_MASSAGE == bytes.fromhex("040280000000")
-        assert DewertOkinCommands.HEAD_MASSAGE == bytes.fromhex("040200000800")
-        assert DewertOkinCommands.FOOT_MASSAGE == bytes.fromhex("040200400000")
-        assert DewertOkinCommands.MASSAGE_OFF == bytes.fromhex("040202000000")
+        assert getattr(DewertOkinCommands, name) == expected
 
-    def test_light_commands(self):
+    @pytest.mark.parametrize("name,expected", list(_EXPECTED_LIGHTS.items()))
+    def test_light_commands(self, name: str, expected: bytes):
         """Test light commands are correct."""
-        assert DewertOkinCommands.UNDERLIGHT == bytes.fromhex("040200020000")
+        assert getattr(DewertOkinCommands, name) == expected
 
     def test_command_lengths(self):
         """Test all commands are 6 bytes."""
-        commands = [
-            DewertOkinCommands.FLAT,
-            DewertOkinCommands.ZERO_G,
-            DewertOkinCommands.TV,
-            DewertOkinCommands.QUIET_SLEEP,
-            DewertOkinCommands.MEMORY_1,
-            DewertOkinCommands.MEMORY_2,
-            DewertOkinCommands.HEAD_UP,
-            DewertOkinCommands.HEAD_DOWN,
-            DewertOkinCommands.FOOT_UP,
-            DewertOkinCommands.FOOT_DOWN,
-            DewertOkinCommands.WAVE_MASSAGE,
-            DewertOkinCommands.HEAD_MASSAGE,
-            DewertOkinCommands.FOOT_MASSAGE,
-            DewertOkinCommands.MASSAGE_OFF,
-            DewertOkinCommands.UNDERLIGHT,
-            DewertOkinCommands.STOP,
-        ]
-        for cmd in commands:
-            assert len(cmd) == 6, f"Command {cmd.hex()} should be 6 bytes"
+        for name in _EXPECTED_COMMANDS:
+            cmd = getattr(DewertOkinCommands, name)
+            assert len(cmd) == 6, f"Command {name} ({cmd.hex()}) should be 6 bytes"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dewertokin_config_entry_data() -> dict:
-    """Return mock config entry data for DewertOkin bed."""
+    """Return mock config entry data for DewertOkin bed.
+
+    Shared by every test in the module, so tests must not mutate it.
+    """
     return {
         CONF_ADDRESS: "AA:BB:CC:DD:EE:FF",
         CONF_NAME: "DewertOkin Test Bed",
@@ -112,36 +177,39 @@ def mock_dewertokin_config_entry(
     return entry
 
 
+@pytest.fixture
+async def dewertokin_coordinator(
+    hass: HomeAssistant,
+    mock_dewertokin_config_entry: MockConfigEntry,
+    mock_coordinator_connected,
+) -> AsyncGenerator[AdjustableBedCoordinator, None]:
+    """Return a coordinator connected to the mocked DewertOkin bed."""
+    coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
+    await coordinator.async_connect()
+    yield coordinator
+    await coordinator.async_disconnect()
+
+
 class TestDewertOkinController:
     """Test DewertOkin controller."""
 
     async def test_control_characteristic_uuid(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
+        dewertokin_coordinator: AdjustableBedCoordinator,
     ):
         """Test controller reports correct handle-based identifier."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
         # DewertOkin uses handle-based writes, so UUID is a handle placeholder
         expected = f"handle-0x{DEWERTOKIN_WRITE_HANDLE:04x}"
-        assert coordinator.controller.control_characteristic_uuid == expected
+        assert dewertokin_coordinator.controller.control_characteristic_uuid == expected
 
     async def test_write_command(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        command = DewertOkinCommands.STOP
-        await coordinator.controller.write_command(command)
+        command = STOP
+        await dewertokin_coordinator.controller.write_command(command)
 
         # DewertOkin uses handle-based writes (integer handle)
         mock_bleak_client.write_gatt_char.assert_called_with(
@@ -150,17 +218,12 @@ class TestDewertOkinController:
 
     async def test_write_command_with_repeat(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command with repeat count."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        command = DewertOkinCommands.HEAD_UP
-        await coordinator.controller.write_command(
+        command = HEAD_UP
+        await dewertokin_coordinator.controller.write_command(
             command, repeat_count=3, repeat_delay_ms=50
         )
 
@@ -168,237 +231,119 @@ class TestDewertOkinController:
 
     async def test_write_command_not_connected(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
         mock_bleak_client.is_connected = False
 
         with pytest.raises(ConnectionError):
-            await coordinator.controller.write_command(DewertOkinCommands.STOP)
+            await dewertokin_coordinator.controller.write_command(STOP)
 
     async def test_write_command_bleak_error(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command handles BleakError."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
         mock_bleak_client.write_gatt_char.side_effect = BleakError("Write failed")
 
         with pytest.raises(BleakError):
-            await coordinator.controller.write_command(DewertOkinCommands.STOP)
+            await dewertokin_coordinator.controller.write_command(STOP)
 
 
 class TestDewertOkinMovement:
     """Test DewertOkin movement commands."""
 
-    async def test_move_head_up(
+    @pytest.mark.parametrize(
+        "method,expected_command",
+        [
+            ("move_head_up", HEAD_UP),
+            ("move_head_down", HEAD_DOWN),
+            ("move_legs_up", FOOT_UP),
+            ("move_feet_down", FOOT_DOWN),
+        ],
+    )
+    async def test_move(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
+        method: str,
+        expected_command: bytes,
     ):
-        """Test move head up sends commands followed by stop."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_head_up()
-
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        assert len(calls) > 1
+        """Test movement sends the motor command followed by stop."""
+        await getattr(dewertokin_coordinator.controller, method)()
 
+        assert mock_bleak_client.write_gatt_char.call_count > 1
+        assert first_write_data(mock_bleak_client) == expected_command
         # Last call should be stop
-        last_command = calls[-1][0][1]
-        assert last_command == DewertOkinCommands.STOP
-
-    async def test_move_head_down(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test move head down sends commands followed by stop."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_head_down()
-
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        assert len(calls) > 1
-        last_command = calls[-1][0][1]
-        assert last_command == DewertOkinCommands.STOP
-
-    async def test_move_legs_up(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test move legs up sends FOOT_UP command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_legs_up()
-
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        # First call should be FOOT_UP
-        first_command = calls[0][0][1]
-        assert first_command == DewertOkinCommands.FOOT_UP
-
-    async def test_move_feet_down(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test move feet down sends FOOT_DOWN command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_feet_down()
-
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == DewertOkinCommands.FOOT_DOWN
+        assert _last_write(mock_bleak_client) == STOP
 
     async def test_stop_all(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends stop command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.stop_all()
+        await dewertokin_coordinator.controller.stop_all()
 
         mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.STOP, response=False
+            DEWERTOKIN_WRITE_HANDLE, STOP, response=False
         )
 
 
 class TestDewertOkinPresets:
     """Test DewertOkin preset commands."""
 
-    async def test_preset_flat(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test preset flat command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_flat()
-
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == DewertOkinCommands.FLAT
-
-    async def test_preset_zero_g(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test preset zero gravity command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_zero_g()
-
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == DewertOkinCommands.ZERO_G
-
-    async def test_preset_tv(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test preset TV command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_tv()
-
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == DewertOkinCommands.TV
-
-    async def test_preset_anti_snore(
+    @pytest.mark.parametrize(
+        "method,expected_command",
+        [
+            ("preset_flat", FLAT),
+            ("preset_zero_g", ZERO_G),
+            ("preset_tv", TV),
+            ("preset_anti_snore", QUIET_SLEEP),
+        ],
+    )
+    async def test_preset(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
+        method: str,
+        expected_command: bytes,
     ):
-        """Test preset anti-snore/quiet sleep command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_anti_snore()
+        """Test preset commands."""
+        await getattr(dewertokin_coordinator.controller, method)()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == DewertOkinCommands.QUIET_SLEEP
+        assert first_write_data(mock_bleak_client) == expected_command
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
         [
-            (1, DewertOkinCommands.MEMORY_1),
-            (2, DewertOkinCommands.MEMORY_2),
+            (1, MEMORY_1),
+            (2, MEMORY_2),
         ],
     )
     async def test_preset_memory(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: bytes,
     ):
         """Test preset memory commands."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_memory(memory_num)
+        await dewertokin_coordinator.controller.preset_memory(memory_num)
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_command
+        assert first_write_data(mock_bleak_client) == expected_command
 
     async def test_preset_memory_invalid(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test preset memory with invalid number logs warning."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
         # Memory 3 is not supported on DewertOkin
-        await coordinator.controller.preset_memory(3)
+        await dewertokin_coordinator.controller.preset_memory(3)
 
         assert "only support memory presets 1 and 2" in caplog.text
 
@@ -406,110 +351,46 @@ class TestDewertOkinPresets:
 class TestDewertOkinLights:
     """Test DewertOkin light commands."""
 
-    async def test_lights_toggle(
+    # DewertOkin only has a toggle, so lights_on sends it as well
+    @pytest.mark.parametrize("method", ["lights_toggle", "lights_on"])
+    async def test_lights(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
+        method: str,
     ):
-        """Test lights toggle command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.lights_toggle()
+        """Test light commands send the underlight toggle."""
+        await getattr(dewertokin_coordinator.controller, method)()
 
         mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.UNDERLIGHT, response=False
-        )
-
-    async def test_lights_on(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test lights on uses toggle (since DewertOkin only has toggle)."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.lights_on()
-
-        mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.UNDERLIGHT, response=False
+            DEWERTOKIN_WRITE_HANDLE, UNDERLIGHT, response=False
         )
 
 
 class TestDewertOkinMassage:
     """Test DewertOkin massage commands."""
 
-    async def test_massage_toggle(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test massage toggle command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.massage_toggle()
-
-        mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.WAVE_MASSAGE, response=False
-        )
-
-    async def test_massage_off(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test massage off command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.massage_off()
-
-        mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.MASSAGE_OFF, response=False
-        )
-
-    async def test_massage_head_toggle(
-        self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test head massage toggle command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.massage_head_toggle()
-
-        mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.HEAD_MASSAGE, response=False
-        )
-
-    async def test_massage_foot_toggle(
+    @pytest.mark.parametrize(
+        "method,expected_command",
+        [
+            ("massage_toggle", WAVE_MASSAGE),
+            ("massage_off", MASSAGE_OFF),
+            ("massage_head_toggle", HEAD_MASSAGE),
+            ("massage_foot_toggle", FOOT_MASSAGE),
+        ],
+    )
+    async def test_massage(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
+        method: str,
+        expected_command: bytes,
     ):
-        """Test foot massage toggle command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.massage_foot_toggle()
+        """Test massage commands."""
+        await getattr(dewertokin_coordinator.controller, method)()
 
         mock_bleak_client.write_gatt_char.assert_called_with(
-            DEWERTOKIN_WRITE_HANDLE, DewertOkinCommands.FOOT_MASSAGE, response=False
+            DEWERTOKIN_WRITE_HANDLE, expected_command, response=False
         )
 
 
@@ -518,31 +399,21 @@ class TestDewertOkinPositionNotifications:
 
     async def test_start_notify_no_support(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        dewertokin_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test that DewertOkin doesn't support position notifications."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
         callback = MagicMock()
-        await coordinator.controller.start_notify(callback)
+        await dewertokin_coordinator.controller.start_notify(callback)
 
         # Should log that notifications aren't supported
         assert "don't support position notifications" in caplog.text
 
     async def test_read_positions_noop(
         self,
-        hass: HomeAssistant,
-        mock_dewertokin_config_entry,
-        mock_coordinator_connected,
+        dewertokin_coordinator: AdjustableBedCoordinator,
     ):
         """Test read_positions does nothing (not supported)."""
-        coordinator = AdjustableBedCoordinator(hass, mock_dewertokin_config_entry)
-        await coordinator.async_connect()
-
         # Should complete without error
-        await coordinator.controller.read_positions()
+        await dewertokin_coordinator.controller.read_positions()
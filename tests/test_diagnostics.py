@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.const import CONF_ADDRESS, CONF_NAME
@@ -24,6 +24,8 @@ from custom_components.adjustable_bed.diagnostics import (
     async_get_config_entry_diagnostics,
 )
 
+from .conftest import FakeBleakClient
+
 
 @pytest.fixture
 def mock_diagnostics_config_entry_data() -> dict:
@@ -73,21 +75,22 @@ class TestDiagnosticsOutput:
         hass: HomeAssistant,
         mock_diagnostics_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
     ):
         """Test diagnostics when not connected."""
         from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
-        # Set up the coordinator and add to hass data
+        # Set up the coordinator and attach it to the entry
         coordinator = AdjustableBedCoordinator(hass, mock_diagnostics_config_entry)
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][mock_diagnostics_config_entry.entry_id] = coordinator
+        mock_diagnostics_config_entry.runtime_data = coordinator
 
-        # Mock disconnected state
-        mock_bleak_client.is_connected = False
+        # Connect, then drop the connection again
+        await coordinator.async_connect()
+        await coordinator.async_disconnect()
 
         result = await async_get_config_entry_diagnostics(hass, mock_diagnostics_config_entry)
 
+        assert result["ble"]["connected"] is False
+
         # Check structure
         assert "entry" in result
         assert "config" in result
@@ -102,7 +105,7 @@ class TestDiagnosticsOutput:
         hass: HomeAssistant,
         mock_diagnostics_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test diagnostics when connected."""
         from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
@@ -111,8 +114,7 @@ class TestDiagnosticsOutput:
         coordinator = AdjustableBedCoordinator(hass, mock_diagnostics_config_entry)
         await coordinator.async_connect()
 
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][mock_diagnostics_config_entry.entry_id] = coordinator
+        mock_diagnostics_config_entry.runtime_data = coordinator
 
         result = await async_get_config_entry_diagnostics(hass, mock_diagnostics_config_entry)
 
@@ -148,8 +150,7 @@ class TestDiagnosticsOutput:
         coordinator = AdjustableBedCoordinator(hass, mock_diagnostics_config_entry)
         await coordinator.async_connect()
 
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][mock_diagnostics_config_entry.entry_id] = coordinator
+        mock_diagnostics_config_entry.runtime_data = coordinator
 
         result = await async_get_config_entry_diagnostics(hass, mock_diagnostics_config_entry)
 
@@ -170,8 +171,7 @@ class TestDiagnosticsOutput:
         coordinator = AdjustableBedCoordinator(hass, mock_diagnostics_config_entry)
         await coordinator.async_connect()
 
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][mock_diagnostics_config_entry.entry_id] = coordinator
+        mock_diagnostics_config_entry.runtime_data = coordinator
 
         result = await async_get_config_entry_diagnostics(hass, mock_diagnostics_config_entry)
 
@@ -191,8 +191,7 @@ class TestDiagnosticsOutput:
         from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
         coordinator = AdjustableBedCoordinator(hass, mock_diagnostics_config_entry)
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN][mock_diagnostics_config_entry.entry_id] = coordinator
+        mock_diagnostics_config_entry.runtime_data = coordinator
 
         result = await async_get_config_entry_diagnostics(hass, mock_diagnostics_config_entry)
 
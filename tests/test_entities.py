@@ -2,20 +2,43 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
 import pytest
+from bleak.exc import BleakError
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 
+from custom_components.adjustable_bed.beds.base import BedController
+from custom_components.adjustable_bed.beds.linak import LinakController
 from custom_components.adjustable_bed.const import DOMAIN
+from custom_components.adjustable_bed.cover import COVER_DESCRIPTIONS
+from custom_components.adjustable_bed.switch import SWITCH_DESCRIPTIONS
 
-from .conftest import TEST_ADDRESS
+from .conftest import TEST_ADDRESS, FakeBleakClient
 
 # Import enable_custom_integrations fixture
 from pytest_homeassistant_custom_component.plugins import enable_custom_integrations  # noqa: F401
 
+_ADDR_SLUG = TEST_ADDRESS.replace(":", "_").lower()
+
+
+@pytest.fixture
+def entities_by_domain(hass: HomeAssistant):
+    """Return a callable bucketing the current states by entity domain."""
+
+    def _group() -> dict[str, list]:
+        groups: dict[str, list] = {
+            domain: [] for domain in ("cover", "button", "switch", "sensor")
+        }
+        for state in hass.states.async_all():
+            if (bucket := groups.get(state.domain)) is not None:
+                bucket.append(state)
+        return groups
+
+    return _group
+
 
 class TestCoverEntities:
     """Test cover entities."""
@@ -26,22 +49,18 @@ class TestCoverEntities:
         mock_config_entry,
         mock_coordinator_connected,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test cover entities are created based on motor count."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         # With 2 motors, should have back and legs covers
-        back_state = hass.states.get(f"cover.{TEST_ADDRESS.replace(':', '_').lower()}_back")
-        legs_state = hass.states.get(f"cover.{TEST_ADDRESS.replace(':', '_').lower()}_legs")
+        back_state = hass.states.get(f"cover.{_ADDR_SLUG}_back")
+        legs_state = hass.states.get(f"cover.{_ADDR_SLUG}_legs")
 
         # Note: Entity names may be different based on translation
         # Check we have the expected number of cover entities
-        cover_states = [
-            state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("cover.")
-        ]
+        cover_states = entities_by_domain()["cover"]
         assert len(cover_states) == 2  # back and legs for 2-motor bed
 
     async def test_cover_open_close(
@@ -49,18 +68,17 @@ class TestCoverEntities:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test cover open and close commands."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         # Get a cover entity
         cover_entities = [
             state.entity_id
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("cover.")
+            for state in entities_by_domain()["cover"]
         ]
         assert len(cover_entities) > 0
 
@@ -75,7 +93,7 @@ class TestCoverEntities:
         )
 
         # Verify command was sent
-        assert mock_bleak_client.write_gatt_char.call_count >= 1
+        assert mock_bleak_client.write_gatt_char.called
         mock_bleak_client.write_gatt_char.reset_mock()
 
         # Test close
@@ -86,24 +104,23 @@ class TestCoverEntities:
             blocking=True,
         )
 
-        assert mock_bleak_client.write_gatt_char.call_count >= 1
+        assert mock_bleak_client.write_gatt_char.called
 
     async def test_cover_stop(
         self,
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test cover stop command."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         cover_entities = [
             state.entity_id
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("cover.")
+            for state in entities_by_domain()["cover"]
         ]
         entity_id = cover_entities[0]
 
@@ -114,7 +131,17 @@ class TestCoverEntities:
             blocking=True,
         )
 
-        mock_bleak_client.write_gatt_char.assert_called()
+        assert mock_bleak_client.write_gatt_char.called
+
+    def test_cover_actions_are_controller_methods(self):
+        """Test every cover action names a BedController method."""
+        for description in COVER_DESCRIPTIONS:
+            for action in (
+                description.open_action,
+                description.close_action,
+                description.stop_action,
+            ):
+                assert callable(getattr(BedController, action))
 
 
 class TestButtonEntities:
@@ -126,16 +153,12 @@ class TestButtonEntities:
         mock_config_entry,
         mock_coordinator_connected,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test button entities are created."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
-        button_states = [
-            state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("button.")
-        ]
+        button_states = entities_by_domain()["button"]
 
         # Should have: memory presets (4) + save_to_memory (4) + flat (1) + stop_all (1) + connect (1) + disconnect (1) = 12
         # Massage buttons are excluded because has_massage=False
@@ -147,29 +170,24 @@ class TestButtonEntities:
         mock_config_entry_data: dict,
         mock_coordinator_connected,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test massage button entities are created when has_massage=True."""
         from pytest_homeassistant_custom_component.common import MockConfigEntry
 
         # Create entry with massage enabled
-        mock_config_entry_data["has_massage"] = True
         entry = MockConfigEntry(
             domain=DOMAIN,
             title="Test Bed",
-            data=mock_config_entry_data,
+            data={**mock_config_entry_data, "has_massage": True},
             unique_id="AA:BB:CC:DD:EE:FF",
             entry_id="massage_entry_id",
         )
         entry.add_to_hass(hass)
 
         await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
 
-        button_states = [
-            state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("button.")
-        ]
+        button_states = entities_by_domain()["button"]
 
         # Should have: base (12) + massage buttons (11) = 23
         # Base: memory presets (4) + save_to_memory (4) + flat (1) + stop_all (1) + connect (1) + disconnect (1)
@@ -180,18 +198,18 @@ class TestButtonEntities:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test pressing a preset button sends command."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         # Find a preset button
         button_entities = [
             state.entity_id
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("button.") and "memory_1" in state.entity_id
+            for state in entities_by_domain()["button"]
+            if "memory_1" in state.entity_id
         ]
         assert len(button_entities) > 0
 
@@ -204,7 +222,7 @@ class TestButtonEntities:
             blocking=True,
         )
 
-        mock_bleak_client.write_gatt_char.assert_called()
+        assert mock_bleak_client.write_gatt_char.called
 
 
 class TestSwitchEntities:
@@ -216,16 +234,12 @@ class TestSwitchEntities:
         mock_config_entry,
         mock_coordinator_connected,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test switch entities are created."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
-        switch_states = [
-            state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("switch.")
-        ]
+        switch_states = entities_by_domain()["switch"]
 
         # Should have under-bed lights switch
         assert len(switch_states) == 1
@@ -235,17 +249,16 @@ class TestSwitchEntities:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test turning switch on and off."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         switch_entities = [
             state.entity_id
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("switch.")
+            for state in entities_by_domain()["switch"]
         ]
         entity_id = switch_entities[0]
 
@@ -257,7 +270,7 @@ class TestSwitchEntities:
             blocking=True,
         )
 
-        assert mock_bleak_client.write_gatt_char.call_count >= 1
+        assert mock_bleak_client.write_gatt_char.called
         mock_bleak_client.write_gatt_char.reset_mock()
 
         # Turn off
@@ -268,7 +281,87 @@ class TestSwitchEntities:
             blocking=True,
         )
 
-        assert mock_bleak_client.write_gatt_char.call_count >= 1
+        assert mock_bleak_client.write_gatt_char.called
+
+    async def test_switch_repeat_turn_on_keeps_state(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: FakeBleakClient,
+        enable_custom_integrations,
+        entities_by_domain,
+    ):
+        """Test turning an on switch on again resends the command but keeps the state."""
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+        entity_id = entities_by_domain()["switch"][0].entity_id
+
+        await hass.services.async_call(
+            "switch",
+            "turn_on",
+            {"entity_id": entity_id},
+            blocking=True,
+        )
+        first_state = hass.states.get(entity_id)
+        mock_bleak_client.write_gatt_char.reset_mock()
+
+        await hass.services.async_call(
+            "switch",
+            "turn_on",
+            {"entity_id": entity_id},
+            blocking=True,
+        )
+
+        # There is no state feedback, so the command still goes out over BLE
+        assert mock_bleak_client.write_gatt_char.called
+        assert hass.states.get(entity_id).last_updated == first_state.last_updated
+
+    async def test_switch_command_errors(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        mock_coordinator_connected,
+        mock_bleak_client: FakeBleakClient,
+        enable_custom_integrations,
+        entities_by_domain,
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test write failures reach the caller but unsupported features only warn."""
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+
+        entity_id = entities_by_domain()["switch"][0].entity_id
+
+        # A failed write is raised to the service call and leaves the switch off
+        mock_bleak_client.write_gatt_char.side_effect = BleakError("Write failed")
+        with pytest.raises(BleakError):
+            await hass.services.async_call(
+                "switch",
+                "turn_on",
+                {"entity_id": entity_id},
+                blocking=True,
+            )
+
+        assert hass.states.get(entity_id).state == STATE_OFF
+
+        # A bed without the feature is logged, not raised
+        mock_bleak_client.write_gatt_char.side_effect = None
+        with patch.object(LinakController, "lights_on", side_effect=NotImplementedError):
+            await hass.services.async_call(
+                "switch",
+                "turn_on",
+                {"entity_id": entity_id},
+                blocking=True,
+            )
+
+        assert "This bed does not support under_bed_lights feature" in caplog.text
+        assert hass.states.get(entity_id).state == STATE_OFF
+
+    def test_switch_actions_are_controller_methods(self):
+        """Test every switch action names a BedController method."""
+        for description in SWITCH_DESCRIPTIONS:
+            assert callable(getattr(BedController, description.turn_on_action))
+            assert callable(getattr(BedController, description.turn_off_action))
 
 
 class TestSensorEntities:
@@ -280,16 +373,16 @@ class TestSensorEntities:
         mock_config_entry,
         mock_coordinator_connected,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test sensor entities are not created when angle sensing is disabled."""
         # Default config has disable_angle_sensing=True
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         sensor_states = [
             state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("sensor.") and "angle" in state.entity_id
+            for state in entities_by_domain()["sensor"]
+            if "angle" in state.entity_id
         ]
 
         assert len(sensor_states) == 0
@@ -300,28 +393,27 @@ class TestSensorEntities:
         mock_config_entry_data: dict,
         mock_coordinator_connected,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test sensor entities are created when angle sensing is enabled."""
         from pytest_homeassistant_custom_component.common import MockConfigEntry
 
         # Create entry with angle sensing enabled
-        mock_config_entry_data["disable_angle_sensing"] = False
         entry = MockConfigEntry(
             domain=DOMAIN,
             title="Test Bed",
-            data=mock_config_entry_data,
+            data={**mock_config_entry_data, "disable_angle_sensing": False},
             unique_id="AA:BB:CC:DD:EE:FF",
             entry_id="sensor_entry_id",
         )
         entry.add_to_hass(hass)
 
         await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
 
         sensor_states = [
             state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("sensor.") and "angle" in state.entity_id
+            for state in entities_by_domain()["sensor"]
+            if "angle" in state.entity_id
         ]
 
         # With 2 motors, should have back_angle and legs_angle sensors
@@ -336,19 +428,15 @@ class TestEntityAvailability:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         enable_custom_integrations,
+        entities_by_domain,
     ):
         """Test entities are available when coordinator is connected."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         # All entities should be available (not STATE_UNAVAILABLE)
-        cover_entities = [
-            state
-            for state in hass.states.async_all()
-            if state.entity_id.startswith("cover.")
-        ]
+        cover_entities = entities_by_domain()["cover"]
 
         for state in cover_entities:
             current_state = hass.states.get(state.entity_id)
@@ -28,6 +28,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestErgomotionHelpers:
     """Test Ergomotion helper functions."""
@@ -155,7 +157,7 @@ class TestErgomotionController:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -173,7 +175,7 @@ class TestErgomotionController:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -195,7 +197,7 @@ class TestErgomotionMovement:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends movement command then stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -216,7 +218,7 @@ class TestErgomotionMovement:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -232,7 +234,7 @@ class TestErgomotionMovement:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move feet up."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -248,7 +250,7 @@ class TestErgomotionMovement:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends zero command."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -270,7 +272,7 @@ class TestErgomotionPresets:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -279,15 +281,14 @@ class TestErgomotionPresets:
         await coordinator.controller.preset_flat()
 
         expected_cmd = coordinator.controller._build_command(ErgomotionCommands.PRESET_FLAT)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -296,15 +297,14 @@ class TestErgomotionPresets:
         await coordinator.controller.preset_zero_g()
 
         expected_cmd = coordinator.controller._build_command(ErgomotionCommands.PRESET_ZERO_G)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_preset_tv(
         self,
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset TV command."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -313,8 +313,7 @@ class TestErgomotionPresets:
         await coordinator.controller.preset_tv()
 
         expected_cmd = coordinator.controller._build_command(ErgomotionCommands.PRESET_TV)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     @pytest.mark.parametrize(
         "memory_num,expected_value",
@@ -330,7 +329,7 @@ class TestErgomotionPresets:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_value: int,
     ):
@@ -341,15 +340,14 @@ class TestErgomotionPresets:
         await coordinator.controller.preset_memory(memory_num)
 
         expected_cmd = coordinator.controller._build_command(expected_value)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_program_memory_not_supported(
         self,
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test program memory logs warning."""
@@ -369,7 +367,7 @@ class TestErgomotionLights:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -391,7 +389,7 @@ class TestErgomotionMassage:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -409,7 +407,7 @@ class TestErgomotionMassage:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage intensity up."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -427,7 +425,7 @@ class TestErgomotionMassage:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test foot massage intensity down."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
@@ -449,7 +447,7 @@ class TestErgomotionPositionNotifications:
         hass: HomeAssistant,
         mock_ergomotion_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test starting position notifications."""
         coordinator = AdjustableBedCoordinator(hass, mock_ergomotion_config_entry)
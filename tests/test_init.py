@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from bleak.exc import BleakError
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 
 from custom_components.adjustable_bed import (
     SERVICE_GOTO_PRESET,
     SERVICE_SAVE_PRESET,
     SERVICE_STOP_ALL,
+    _async_register_services,
 )
-from custom_components.adjustable_bed.const import DOMAIN
+from custom_components.adjustable_bed.beds.linak import LinakCommands
+from custom_components.adjustable_bed.const import DOMAIN, LINAK_CONTROL_CHAR_UUID
+from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
+
+from .conftest import TEST_ADDRESS, FakeBleakClient, assert_last_write
 
 
 # Import enable_custom_integrations fixture
 from pytest_homeassistant_custom_component.plugins import enable_custom_integrations  # noqa: F401
 
+ALL_SERVICES = (SERVICE_GOTO_PRESET, SERVICE_SAVE_PRESET, SERVICE_STOP_ALL)
+SECOND_ADDRESS = "11:22:33:44:55:66"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations for every test in this module."""
+    yield
+
 
 class TestIntegrationSetup:
     """Test integration setup."""
@@ -28,66 +44,53 @@ class TestIntegrationSetup:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        enable_custom_integrations,
     ):
         """Test successful setup of config entry."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         assert mock_config_entry.state == ConfigEntryState.LOADED
-        assert DOMAIN in hass.data
-        assert mock_config_entry.entry_id in hass.data[DOMAIN]
+        assert isinstance(mock_config_entry.runtime_data, AdjustableBedCoordinator)
 
     async def test_setup_entry_registers_services(
         self,
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        enable_custom_integrations,
     ):
         """Test setup registers services."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
-        assert hass.services.has_service(DOMAIN, SERVICE_GOTO_PRESET)
-        assert hass.services.has_service(DOMAIN, SERVICE_SAVE_PRESET)
-        assert hass.services.has_service(DOMAIN, SERVICE_STOP_ALL)
+        assert all(hass.services.has_service(DOMAIN, service) for service in ALL_SERVICES)
 
     async def test_setup_entry_connection_timeout(
         self,
         hass: HomeAssistant,
         mock_config_entry,
-        mock_async_ble_device_from_address,
-        mock_bluetooth_adapters,
-        enable_custom_integrations,
+        mock_coordinator_connected,
+        mock_establish_connection: AsyncMock,
     ):
         """Test setup fails on connection timeout."""
-        with patch(
-            "custom_components.adjustable_bed.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            side_effect=TimeoutError("Connection timed out"),
-        ):
-            await hass.config_entries.async_setup(mock_config_entry.entry_id)
-            await hass.async_block_till_done()
+        mock_establish_connection.side_effect = TimeoutError("Connection timed out")
+
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
 
         assert mock_config_entry.state == ConfigEntryState.SETUP_RETRY
+        assert not hass.states.async_entity_ids("cover")
 
     async def test_setup_entry_connection_failed(
         self,
         hass: HomeAssistant,
         mock_config_entry,
-        mock_bluetooth_adapters,
-        enable_custom_integrations,
+        mock_coordinator_connected,
+        mock_async_ble_device_from_address: MagicMock,
     ):
         """Test setup fails when connection fails."""
-        with patch(
-            "custom_components.adjustable_bed.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=None,
-        ):
-            await hass.config_entries.async_setup(mock_config_entry.entry_id)
-            await hass.async_block_till_done()
+        mock_async_ble_device_from_address.return_value = None
+
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
 
         assert mock_config_entry.state == ConfigEntryState.SETUP_RETRY
+        assert not hass.states.async_entity_ids("cover")
 
 
 class TestIntegrationUnload:
@@ -98,30 +101,26 @@ class TestIntegrationUnload:
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        enable_custom_integrations,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test successful unload of config entry."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         result = await hass.config_entries.async_unload(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
         assert result is True
         assert mock_config_entry.state == ConfigEntryState.NOT_LOADED
-        mock_bleak_client.disconnect.assert_called()
+        assert mock_bleak_client.disconnect.called
 
     async def test_unload_last_entry_removes_services(
         self,
         hass: HomeAssistant,
         mock_config_entry,
         mock_coordinator_connected,
-        enable_custom_integrations,
     ):
         """Test unloading last entry removes services."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         # Verify services exist
         assert hass.services.has_service(DOMAIN, SERVICE_GOTO_PRESET)
@@ -130,39 +129,25 @@ class TestIntegrationUnload:
         await hass.async_block_till_done()
 
         # Services should be removed
-        assert not hass.services.has_service(DOMAIN, SERVICE_GOTO_PRESET)
-        assert not hass.services.has_service(DOMAIN, SERVICE_SAVE_PRESET)
-        assert not hass.services.has_service(DOMAIN, SERVICE_STOP_ALL)
+        assert not any(hass.services.has_service(DOMAIN, service) for service in ALL_SERVICES)
 
     async def test_unload_keeps_services_with_remaining_entries(
         self,
         hass: HomeAssistant,
         mock_config_entry,
-        mock_config_entry_data: dict,
+        make_entry,
         mock_coordinator_connected,
-        enable_custom_integrations,
     ):
         """Test services are kept when other entries remain."""
-        from pytest_homeassistant_custom_component.common import MockConfigEntry
-
         # Set up first entry
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
         # Verify services exist
         assert hass.services.has_service(DOMAIN, SERVICE_GOTO_PRESET)
 
         # Create and set up a second entry
-        second_entry = MockConfigEntry(
-            domain=DOMAIN,
-            title="Second Bed",
-            data={**mock_config_entry_data, "address": "11:22:33:44:55:66"},
-            unique_id="11:22:33:44:55:66",
-            entry_id="second_entry_id",
-        )
-        second_entry.add_to_hass(hass)
+        second_entry = make_entry(SECOND_ADDRESS, "second_entry_id", "Second Bed")
         await hass.config_entries.async_setup(second_entry.entry_id)
-        await hass.async_block_till_done()
 
         # Unload first entry
         await hass.config_entries.async_unload(mock_config_entry.entry_id)
@@ -179,6 +164,26 @@ class TestIntegrationUnload:
         assert not hass.services.has_service(DOMAIN, SERVICE_GOTO_PRESET)
 
 
+@pytest.fixture
+async def prewired_device_id(hass: HomeAssistant, mock_config_entry) -> str:
+    """Register the services against a loaded entry with a stub coordinator.
+
+    Skips the full entry setup; returns the id of the entry's device.
+    """
+    coordinator = MagicMock(spec=AdjustableBedCoordinator)
+    coordinator.async_execute_controller_command = AsyncMock()
+    coordinator.async_stop_command = AsyncMock()
+    mock_config_entry.runtime_data = coordinator
+    mock_config_entry.mock_state(hass, ConfigEntryState.LOADED)
+
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=mock_config_entry.entry_id,
+        identifiers={(DOMAIN, mock_config_entry.unique_id)},
+    )
+    await _async_register_services(hass)
+    return device.id
+
+
 class TestServices:
     """Test integration services."""
 
@@ -186,59 +191,87 @@ class TestServices:
         self,
         hass: HomeAssistant,
         mock_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        enable_custom_integrations,
+        prewired_device_id: str,
     ):
         """Test goto_preset service calls controller."""
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        # Get the device ID from the device registry
-        from homeassistant.helpers import device_registry as dr
-
-        device_registry = dr.async_get(hass)
-
-        # Find the device created by the integration
-        devices = dr.async_entries_for_config_entry(device_registry, mock_config_entry.entry_id)
-        assert len(devices) == 1
-        device_id = devices[0].id
-
-        # Call the service
         await hass.services.async_call(
             DOMAIN,
             SERVICE_GOTO_PRESET,
-            {"device_id": [device_id], "preset": 1},
+            {"device_id": [prewired_device_id], "preset": 1},
             blocking=True,
         )
 
-        # Verify write_gatt_char was called (preset command)
-        assert mock_bleak_client.write_gatt_char.call_count >= 1
+        # The coordinator receives a command that recalls the requested preset
+        coordinator = mock_config_entry.runtime_data
+        coordinator.async_execute_controller_command.assert_awaited_once()
+        controller = MagicMock()
+        coordinator.async_execute_controller_command.call_args.args[0](controller)
+        controller.preset_memory.assert_called_once_with(1)
 
     async def test_stop_all_service(
         self,
         hass: HomeAssistant,
         mock_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        enable_custom_integrations,
+        prewired_device_id: str,
     ):
         """Test stop_all service calls controller."""
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_STOP_ALL,
+            {"device_id": [prewired_device_id]},
+            blocking=True,
+        )
+
+        mock_config_entry.runtime_data.async_stop_command.assert_awaited_once()
+
+    async def test_save_preset_targets_every_bed(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry,
+        make_entry,
+        mock_coordinator_connected,
+        mock_establish_connection: AsyncMock,
+        mock_bleak_client: FakeBleakClient,
+    ):
+        """Test a service call reaches every targeted bed, even when one fails."""
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
 
-        from homeassistant.helpers import device_registry as dr
+        # Give the second bed its own client so each bed's writes can be told apart
+        second_client = FakeBleakClient()
+        mock_establish_connection.return_value = second_client
+        second_entry = make_entry(SECOND_ADDRESS, "second_entry_id", "Second Bed")
+        await hass.config_entries.async_setup(second_entry.entry_id)
 
         device_registry = dr.async_get(hass)
-        devices = dr.async_entries_for_config_entry(device_registry, mock_config_entry.entry_id)
-        device_id = devices[0].id
+        device_ids = [
+            device_registry.async_get_device(identifiers={(DOMAIN, address)}).id
+            for address in (TEST_ADDRESS, SECOND_ADDRESS)
+        ]
 
         await hass.services.async_call(
             DOMAIN,
-            SERVICE_STOP_ALL,
-            {"device_id": [device_id]},
+            SERVICE_SAVE_PRESET,
+            {"device_id": device_ids, "preset": 1},
             blocking=True,
         )
 
-        # Verify command was sent
-        mock_bleak_client.write_gatt_char.assert_called()
+        for client in (mock_bleak_client, second_client):
+            assert_last_write(
+                client, LINAK_CONTROL_CHAR_UUID, LinakCommands.PROGRAM_MEMORY_1, response=True
+            )
+
+        # A failure on one bed is raised, but the other bed still gets its command
+        mock_bleak_client.write_gatt_char.side_effect = BleakError("Write failed")
+        second_client.write_gatt_char.reset_mock()
+
+        with pytest.raises(BleakError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_SAVE_PRESET,
+                {"device_id": device_ids, "preset": 2},
+                blocking=True,
+            )
+
+        assert_last_write(
+            second_client, LINAK_CONTROL_CHAR_UUID, LinakCommands.PROGRAM_MEMORY_2, response=True
+        )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -26,49 +27,19 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, assert_last_write, assert_no_writes, first_write_data
 
-class TestJiecangCommands:
-    """Test Jiecang command constants."""
-
-    def test_preset_commands(self):
-        """Test preset commands are correct."""
-        assert JiecangCommands.MEMORY_1 == bytes.fromhex("f1f10b01010d7e")
-        assert JiecangCommands.MEMORY_2 == bytes.fromhex("f1f10d01010f7e")
-        assert JiecangCommands.FLAT == bytes.fromhex("f1f10801010a7e")
-        assert JiecangCommands.ZERO_G == bytes.fromhex("f1f1070101097e")
-
-    def test_command_lengths(self):
-        """Test all commands are 7 bytes."""
-        commands = [
-            JiecangCommands.MEMORY_1,
-            JiecangCommands.MEMORY_2,
-            JiecangCommands.FLAT,
-            JiecangCommands.ZERO_G,
-        ]
-        for cmd in commands:
-            assert len(cmd) == 7, f"Command {cmd.hex()} should be 7 bytes"
-
-    def test_command_prefix(self):
-        """Test all commands start with 0xf1f1."""
-        commands = [
-            JiecangCommands.MEMORY_1,
-            JiecangCommands.MEMORY_2,
-            JiecangCommands.FLAT,
-            JiecangCommands.ZERO_G,
-        ]
-        for cmd in commands:
-            assert cmd[:2] == bytes([0xF1, 0xF1]), f"Command {cmd.hex()} should start with f1f1"
-
-    def test_command_suffix(self):
-        """Test all commands end with 0x7e."""
-        commands = [
-            JiecangCommands.MEMORY_1,
-            JiecangCommands.MEMORY_2,
-            JiecangCommands.FLAT,
-            JiecangCommands.ZERO_G,
-        ]
-        for cmd in commands:
-            assert cmd[-1] == 0x7E, f"Command {cmd.hex()} should end with 7e"
+# Repeated commands would otherwise wait out their real repeat delays
+pytestmark = pytest.mark.usefixtures("fast_sleep")
+
+_JIECANG_PRESETS = [
+    pytest.param("preset_flat", JiecangCommands.FLAT, id="flat"),
+    pytest.param("preset_zero_g", JiecangCommands.ZERO_G, id="zero_g"),
+]
+_JIECANG_MEMORY_PRESETS = [
+    pytest.param(1, JiecangCommands.MEMORY_1, id="mem1"),
+    pytest.param(2, JiecangCommands.MEMORY_2, id="mem2"),
+]
 
 
 @pytest.fixture
@@ -101,52 +72,58 @@ def mock_jiecang_config_entry(
     return entry
 
 
+@pytest.fixture
+async def jiecang_coordinator(
+    hass: HomeAssistant,
+    mock_jiecang_config_entry: MockConfigEntry,
+    mock_coordinator_connected,
+) -> AsyncGenerator[AdjustableBedCoordinator, None]:
+    """Return a coordinator connected to the mocked Jiecang bed."""
+    coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
+    await coordinator.async_connect()
+    yield coordinator
+    await coordinator.async_disconnect()
+
+
+@pytest.fixture
+def unconnected_jiecang_controller(mock_bleak_client: FakeBleakClient) -> JiecangController:
+    """Return a Jiecang controller backed by a stub coordinator, without connecting."""
+    return JiecangController(
+        MagicMock(spec=AdjustableBedCoordinator, client=mock_bleak_client)
+    )
+
+
 class TestJiecangController:
     """Test Jiecang controller."""
 
     async def test_control_characteristic_uuid(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
+        unconnected_jiecang_controller: JiecangController,
     ):
         """Test controller reports correct characteristic UUID."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        assert coordinator.controller.control_characteristic_uuid == JIECANG_CHAR_UUID
+        assert unconnected_jiecang_controller.control_characteristic_uuid == JIECANG_CHAR_UUID
 
     async def test_write_command(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
         command = JiecangCommands.FLAT
-        await coordinator.controller.write_command(command)
+        await jiecang_coordinator.controller.write_command(command)
 
-        mock_bleak_client.write_gatt_char.assert_called_with(
-            JIECANG_CHAR_UUID, command, response=False
+        assert_last_write(
+            mock_bleak_client, JIECANG_CHAR_UUID, command, response=False
         )
 
     async def test_write_command_with_repeat(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command with repeat count."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
         command = JiecangCommands.FLAT
-        await coordinator.controller.write_command(
+        await jiecang_coordinator.controller.write_command(
             command, repeat_count=3, repeat_delay_ms=100
         )
 
@@ -154,269 +131,123 @@ class TestJiecangController:
 
     async def test_write_command_not_connected(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
         mock_bleak_client.is_connected = False
 
         with pytest.raises(ConnectionError):
-            await coordinator.controller.write_command(JiecangCommands.FLAT)
+            await jiecang_coordinator.controller.write_command(JiecangCommands.FLAT)
 
 
 class TestJiecangMotorMovement:
     """Test Jiecang motor movement commands (preset-only limitation)."""
 
-    async def test_move_head_up_warns(
+    @pytest.mark.parametrize(
+        "method_name",
+        [
+            "move_head_up",
+            "move_head_down",
+            "move_legs_up",
+            "move_legs_down",
+            "move_feet_up",
+            "move_back_up",
+        ],
+    )
+    async def test_motor_movement_warns(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         caplog,
+        method_name: str,
     ):
-        """Test move head up logs warning about preset-only limitation."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_head_up()
+        """Test motor movement logs warning about preset-only limitation."""
+        await getattr(jiecang_coordinator.controller, method_name)()
 
         assert "only support preset positions" in caplog.text
         # Should not send any command
-        mock_bleak_client.write_gatt_char.assert_not_called()
-
-    async def test_move_head_down_warns(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        caplog,
-    ):
-        """Test move head down logs warning about preset-only limitation."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_head_down()
-
-        assert "only support preset positions" in caplog.text
-        mock_bleak_client.write_gatt_char.assert_not_called()
-
-    async def test_move_legs_up_warns(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        caplog,
-    ):
-        """Test move legs up logs warning."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_legs_up()
-
-        assert "only support preset positions" in caplog.text
-
-    async def test_move_legs_down_warns(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        caplog,
-    ):
-        """Test move legs down logs warning."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_legs_down()
-
-        assert "only support preset positions" in caplog.text
-
-    async def test_move_feet_up_warns(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        caplog,
-    ):
-        """Test move feet up logs warning."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_feet_up()
-
-        assert "only support preset positions" in caplog.text
-
-    async def test_move_back_up_warns(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-        caplog,
-    ):
-        """Test move back up logs warning."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_back_up()
-
-        assert "only support preset positions" in caplog.text
+        assert_no_writes(mock_bleak_client)
 
     async def test_stop_all_noop(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        unconnected_jiecang_controller: JiecangController,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all does nothing (motor control not supported)."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.stop_all()
+        await unconnected_jiecang_controller.stop_all()
 
         # Should not send any command
-        mock_bleak_client.write_gatt_char.assert_not_called()
+        assert_no_writes(mock_bleak_client)
 
     async def test_move_head_stop_noop(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        unconnected_jiecang_controller: JiecangController,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head stop does nothing."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.move_head_stop()
+        await unconnected_jiecang_controller.move_head_stop()
 
-        mock_bleak_client.write_gatt_char.assert_not_called()
+        assert_no_writes(mock_bleak_client)
 
 
 class TestJiecangPresets:
     """Test Jiecang preset commands."""
 
-    async def test_preset_flat(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test preset flat command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_flat()
-
-        # Check first call was FLAT command
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == JiecangCommands.FLAT
-
-    async def test_preset_zero_g(
+    @pytest.mark.parametrize("preset_call,expected", _JIECANG_PRESETS)
+    async def test_preset(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
+        preset_call: str,
+        expected: bytes,
     ):
-        """Test preset zero gravity command."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_zero_g()
+        """Test preset commands are sent with repeat (3 times per code)."""
+        await getattr(jiecang_coordinator.controller, preset_call)()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == JiecangCommands.ZERO_G
+        assert first_write_data(mock_bleak_client) == expected
+        assert mock_bleak_client.write_gatt_char.call_count == 3
 
-    @pytest.mark.parametrize(
-        "memory_num,expected_command",
-        [
-            (1, JiecangCommands.MEMORY_1),
-            (2, JiecangCommands.MEMORY_2),
-        ],
-    )
+    @pytest.mark.parametrize("memory_num,expected_command", _JIECANG_MEMORY_PRESETS)
     async def test_preset_memory(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: bytes,
     ):
         """Test preset memory commands."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
+        await jiecang_coordinator.controller.preset_memory(memory_num)
 
-        await coordinator.controller.preset_memory(memory_num)
-
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_command
+        assert first_write_data(mock_bleak_client) == expected_command
 
     async def test_preset_memory_invalid(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test preset memory with invalid number logs warning."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
         # Memory 3 is not supported on Jiecang
-        await coordinator.controller.preset_memory(3)
+        await jiecang_coordinator.controller.preset_memory(3)
 
         assert "only support memory presets 1 and 2" in caplog.text
 
-    async def test_preset_commands_repeat(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
-    ):
-        """Test preset commands are sent with repeat (3 times per code)."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.preset_flat()
-
-        # Jiecang presets use repeat_count=3
-        assert mock_bleak_client.write_gatt_char.call_count == 3
-
 
 class TestJiecangProgramMemory:
     """Test Jiecang program memory (not supported)."""
 
     async def test_program_memory_warns(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        jiecang_coordinator: AdjustableBedCoordinator,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test program memory logs warning about not being supported."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        await coordinator.controller.program_memory(1)
+        await jiecang_coordinator.controller.program_memory(1)
 
         assert "don't support programming memory presets" in caplog.text
-        mock_bleak_client.write_gatt_char.assert_not_called()
+        assert_no_writes(mock_bleak_client)
 
 
 class TestJiecangPositionNotifications:
@@ -424,42 +255,23 @@ class TestJiecangPositionNotifications:
 
     async def test_start_notify_no_support(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
+        jiecang_coordinator: AdjustableBedCoordinator,
         caplog,
     ):
         """Test that Jiecang doesn't support position notifications."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
         callback = MagicMock()
-        await coordinator.controller.start_notify(callback)
+        await jiecang_coordinator.controller.start_notify(callback)
 
         assert "don't support position notifications" in caplog.text
 
-    async def test_read_positions_noop(
-        self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
-    ):
-        """Test read_positions does nothing (not supported)."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
-
-        # Should complete without error
-        await coordinator.controller.read_positions()
-
-    async def test_stop_notify_noop(
+    @pytest.mark.parametrize("method", ["read_positions", "stop_notify"])
+    async def test_noop(
         self,
-        hass: HomeAssistant,
-        mock_jiecang_config_entry,
-        mock_coordinator_connected,
+        unconnected_jiecang_controller: JiecangController,
+        mock_bleak_client: FakeBleakClient,
+        method: str,
     ):
-        """Test stop_notify completes without error."""
-        coordinator = AdjustableBedCoordinator(hass, mock_jiecang_config_entry)
-        await coordinator.async_connect()
+        """Test unsupported notification methods complete without doing anything."""
+        await getattr(unconnected_jiecang_controller, method)()
 
-        # Should complete without error
-        await coordinator.controller.stop_notify()
+        assert_no_writes(mock_bleak_client)
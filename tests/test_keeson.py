@@ -28,6 +28,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestKeesonHelpers:
     """Test Keeson helper functions."""
@@ -167,7 +169,7 @@ class TestKeesonController:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -185,7 +187,7 @@ class TestKeesonController:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -207,7 +209,7 @@ class TestKeesonMovement:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends commands followed by stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -228,7 +230,7 @@ class TestKeesonMovement:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -244,7 +246,7 @@ class TestKeesonMovement:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move feet up."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -260,7 +262,7 @@ class TestKeesonMovement:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends zero command."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -282,7 +284,7 @@ class TestKeesonPresets:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -291,15 +293,14 @@ class TestKeesonPresets:
         await coordinator.controller.preset_flat()
 
         expected_cmd = coordinator.controller._build_command(KeesonCommands.PRESET_FLAT)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -308,8 +309,7 @@ class TestKeesonPresets:
         await coordinator.controller.preset_zero_g()
 
         expected_cmd = coordinator.controller._build_command(KeesonCommands.PRESET_ZERO_G)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     @pytest.mark.parametrize(
         "memory_num,expected_value",
@@ -325,7 +325,7 @@ class TestKeesonPresets:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_value: int,
     ):
@@ -336,15 +336,14 @@ class TestKeesonPresets:
         await coordinator.controller.preset_memory(memory_num)
 
         expected_cmd = coordinator.controller._build_command(expected_value)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_program_memory_not_supported(
         self,
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test program memory logs warning."""
@@ -364,7 +363,7 @@ class TestKeesonLights:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -386,7 +385,7 @@ class TestKeesonMassage:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -404,7 +403,7 @@ class TestKeesonMassage:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage intensity up."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
@@ -422,7 +421,7 @@ class TestKeesonMassage:
         hass: HomeAssistant,
         mock_keeson_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test foot massage intensity down."""
         coordinator = AdjustableBedCoordinator(hass, mock_keeson_config_entry)
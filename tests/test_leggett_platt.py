@@ -29,6 +29,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestLeggettPlattHelpers:
     """Test Leggett & Platt helper functions."""
@@ -150,7 +152,7 @@ class TestLeggettPlattControllerGen2:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -197,7 +199,7 @@ class TestLeggettPlattMovement:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test move head up on Gen2 logs warning (position-based control)."""
@@ -213,7 +215,7 @@ class TestLeggettPlattMovement:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head stop sends STOP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -230,7 +232,7 @@ class TestLeggettPlattMovement:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends STOP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -251,7 +253,7 @@ class TestLeggettPlattPresets:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command on Gen2."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -259,15 +261,14 @@ class TestLeggettPlattPresets:
 
         await coordinator.controller.preset_flat()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == LeggettPlattGen2Commands.PRESET_FLAT
+        assert first_write_data(mock_bleak_client) == LeggettPlattGen2Commands.PRESET_FLAT
 
     async def test_preset_anti_snore_gen2(
         self,
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset anti-snore command on Gen2."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -275,8 +276,7 @@ class TestLeggettPlattPresets:
 
         await coordinator.controller.preset_anti_snore()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == LeggettPlattGen2Commands.PRESET_ANTI_SNORE
+        assert first_write_data(mock_bleak_client) == LeggettPlattGen2Commands.PRESET_ANTI_SNORE
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
@@ -292,7 +292,7 @@ class TestLeggettPlattPresets:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: bytes,
     ):
@@ -302,8 +302,7 @@ class TestLeggettPlattPresets:
 
         await coordinator.controller.preset_memory(memory_num)
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_command
+        assert first_write_data(mock_bleak_client) == expected_command
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
@@ -319,7 +318,7 @@ class TestLeggettPlattPresets:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: bytes,
     ):
@@ -342,7 +341,7 @@ class TestLeggettPlattLights:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle on Gen2 sends RGB_OFF command."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -359,7 +358,7 @@ class TestLeggettPlattLights:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights on Gen2 sends RGB white command."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -377,7 +376,7 @@ class TestLeggettPlattLights:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights off Gen2 sends RGB_OFF command."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -398,7 +397,7 @@ class TestLeggettPlattMassage:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage off on Gen2."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -415,7 +414,7 @@ class TestLeggettPlattMassage:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage up on Gen2."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
@@ -434,7 +433,7 @@ class TestLeggettPlattMassage:
         hass: HomeAssistant,
         mock_leggett_gen2_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage toggle on Gen2."""
         coordinator = AdjustableBedCoordinator(hass, mock_leggett_gen2_config_entry)
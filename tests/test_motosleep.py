@@ -26,6 +26,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestMotoSleepCommands:
     """Test MotoSleep command constants."""
@@ -138,7 +140,7 @@ class TestMotoSleepController:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -156,7 +158,7 @@ class TestMotoSleepController:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -178,7 +180,7 @@ class TestMotoSleepMovement:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends HEAD_UP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -186,18 +188,16 @@ class TestMotoSleepMovement:
 
         await coordinator.controller.move_head_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
         # First call should be HEAD_UP
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(MotoSleepCommands.MOTOR_HEAD_UP)
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_move_head_down(
         self,
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down sends HEAD_DOWN command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -205,17 +205,15 @@ class TestMotoSleepMovement:
 
         await coordinator.controller.move_head_down()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(MotoSleepCommands.MOTOR_HEAD_DOWN)
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_move_feet_up(
         self,
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move feet up sends FEET_UP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -223,17 +221,15 @@ class TestMotoSleepMovement:
 
         await coordinator.controller.move_feet_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(MotoSleepCommands.MOTOR_FEET_UP)
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_move_head_stop_noop(
         self,
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head stop does nothing (MotoSleep stops when button released)."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -249,7 +245,7 @@ class TestMotoSleepMovement:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends massage stop command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -271,7 +267,7 @@ class TestMotoSleepPresets:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat/home command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -280,15 +276,14 @@ class TestMotoSleepPresets:
         await coordinator.controller.preset_flat()
 
         expected = coordinator.controller._build_command(MotoSleepCommands.PRESET_HOME)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -297,15 +292,14 @@ class TestMotoSleepPresets:
         await coordinator.controller.preset_zero_g()
 
         expected = coordinator.controller._build_command(MotoSleepCommands.PRESET_ZERO_G)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_preset_tv(
         self,
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset TV command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -314,15 +308,14 @@ class TestMotoSleepPresets:
         await coordinator.controller.preset_tv()
 
         expected = coordinator.controller._build_command(MotoSleepCommands.PRESET_TV)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_preset_anti_snore(
         self,
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset anti-snore command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -331,8 +324,7 @@ class TestMotoSleepPresets:
         await coordinator.controller.preset_anti_snore()
 
         expected = coordinator.controller._build_command(MotoSleepCommands.PRESET_ANTI_SNORE)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     @pytest.mark.parametrize(
         "memory_num,expected_char",
@@ -346,7 +338,7 @@ class TestMotoSleepPresets:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_char: int,
     ):
@@ -357,8 +349,7 @@ class TestMotoSleepPresets:
         await coordinator.controller.preset_memory(memory_num)
 
         expected = coordinator.controller._build_command(expected_char)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     @pytest.mark.parametrize(
         "memory_num,expected_char",
@@ -372,7 +363,7 @@ class TestMotoSleepPresets:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_char: int,
     ):
@@ -396,7 +387,7 @@ class TestMotoSleepLights:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -418,7 +409,7 @@ class TestMotoSleepMassage:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage off command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -436,7 +427,7 @@ class TestMotoSleepMassage:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -454,7 +445,7 @@ class TestMotoSleepMassage:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test foot massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
@@ -472,7 +463,7 @@ class TestMotoSleepMassage:
         hass: HomeAssistant,
         mock_motosleep_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage intensity up."""
         coordinator = AdjustableBedCoordinator(hass, mock_motosleep_config_entry)
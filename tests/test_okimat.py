@@ -27,6 +27,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestOkimatHelpers:
     """Test Okimat helper functions."""
@@ -143,7 +145,7 @@ class TestOkimatController:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -161,7 +163,7 @@ class TestOkimatController:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -183,7 +185,7 @@ class TestOkimatMovement:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends commands followed by stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -204,7 +206,7 @@ class TestOkimatMovement:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -220,7 +222,7 @@ class TestOkimatMovement:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move feet up."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -236,7 +238,7 @@ class TestOkimatMovement:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends zero command."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -258,7 +260,7 @@ class TestOkimatPresets:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -267,8 +269,7 @@ class TestOkimatPresets:
         await coordinator.controller.preset_flat()
 
         expected_cmd = coordinator.controller._build_command(OkimatCommands.PRESET_FLAT)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     @pytest.mark.parametrize(
         "memory_num,expected_value",
@@ -284,7 +285,7 @@ class TestOkimatPresets:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_value: int,
     ):
@@ -295,15 +296,14 @@ class TestOkimatPresets:
         await coordinator.controller.preset_memory(memory_num)
 
         expected_cmd = coordinator.controller._build_command(expected_value)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_program_memory_not_supported(
         self,
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test program memory logs warning."""
@@ -323,7 +323,7 @@ class TestOkimatLights:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -345,7 +345,7 @@ class TestOkimatMassage:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -363,7 +363,7 @@ class TestOkimatMassage:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage intensity up."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -381,7 +381,7 @@ class TestOkimatMassage:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test foot massage intensity down."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
@@ -399,7 +399,7 @@ class TestOkimatMassage:
         hass: HomeAssistant,
         mock_okimat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage timer step."""
         coordinator = AdjustableBedCoordinator(hass, mock_okimat_config_entry)
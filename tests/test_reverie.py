@@ -26,6 +26,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestReverieCommands:
     """Test Reverie command constants."""
@@ -147,7 +149,7 @@ class TestReverieController:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -165,7 +167,7 @@ class TestReverieController:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -187,7 +189,7 @@ class TestReverieMovement:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up moves to 100%."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -196,17 +198,15 @@ class TestReverieMovement:
         await coordinator.controller.move_head_up()
 
         # Should send motor_head(100) command
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(ReverieCommands.motor_head(100))
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_move_head_down(
         self,
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down moves to 0%."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -214,17 +214,15 @@ class TestReverieMovement:
 
         await coordinator.controller.move_head_down()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(ReverieCommands.motor_head(0))
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_move_legs_up(
         self,
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move legs up moves feet to 100%."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -232,17 +230,15 @@ class TestReverieMovement:
 
         await coordinator.controller.move_legs_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(ReverieCommands.motor_feet(100))
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_stop_all(
         self,
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends MOTOR_STOP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -264,7 +260,7 @@ class TestReveriePresets:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -273,15 +269,14 @@ class TestReveriePresets:
         await coordinator.controller.preset_flat()
 
         expected = coordinator.controller._build_command(ReverieCommands.PRESET_FLAT)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -290,15 +285,14 @@ class TestReveriePresets:
         await coordinator.controller.preset_zero_g()
 
         expected = coordinator.controller._build_command(ReverieCommands.PRESET_ZERO_G)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_preset_anti_snore(
         self,
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset anti-snore command."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -307,8 +301,7 @@ class TestReveriePresets:
         await coordinator.controller.preset_anti_snore()
 
         expected = coordinator.controller._build_command(ReverieCommands.PRESET_ANTI_SNORE)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
@@ -324,7 +317,7 @@ class TestReveriePresets:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: list,
     ):
@@ -335,8 +328,7 @@ class TestReveriePresets:
         await coordinator.controller.preset_memory(memory_num)
 
         expected = coordinator.controller._build_command(expected_command)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
@@ -352,7 +344,7 @@ class TestReveriePresets:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: list,
     ):
@@ -376,7 +368,7 @@ class TestReverieLights:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -398,7 +390,7 @@ class TestReverieMassage:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage off command."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -415,7 +407,7 @@ class TestReverieMassage:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage intensity up."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -434,7 +426,7 @@ class TestReverieMassage:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage intensity down (stays at 0)."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -453,7 +445,7 @@ class TestReverieMassage:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage wave mode step."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -476,7 +468,7 @@ class TestReveriePositionNotifications:
         hass: HomeAssistant,
         mock_reverie_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test starting position notifications."""
         coordinator = AdjustableBedCoordinator(hass, mock_reverie_config_entry)
@@ -26,6 +26,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestRichmatCommands:
     """Test Richmat command constants."""
@@ -161,7 +163,7 @@ class TestRichmatController:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -179,7 +181,7 @@ class TestRichmatController:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -201,7 +203,7 @@ class TestRichmatMovement:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends commands followed by stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -222,7 +224,7 @@ class TestRichmatMovement:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -238,7 +240,7 @@ class TestRichmatMovement:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move legs up sends FEET_UP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -246,18 +248,16 @@ class TestRichmatMovement:
 
         await coordinator.controller.move_legs_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
         # First call should be FEET_UP
-        first_command = calls[0][0][1]
         expected = coordinator.controller._build_command(RichmatCommands.MOTOR_FEET_UP)
-        assert first_command == expected
+        assert first_write_data(mock_bleak_client) == expected
 
     async def test_stop_all(
         self,
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends END command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -279,7 +279,7 @@ class TestRichmatPresets:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -288,15 +288,14 @@ class TestRichmatPresets:
         await coordinator.controller.preset_flat()
 
         expected_cmd = coordinator.controller._build_command(RichmatCommands.PRESET_FLAT)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -305,15 +304,14 @@ class TestRichmatPresets:
         await coordinator.controller.preset_zero_g()
 
         expected_cmd = coordinator.controller._build_command(RichmatCommands.PRESET_ZERO_G)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_preset_tv(
         self,
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset TV command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -322,15 +320,14 @@ class TestRichmatPresets:
         await coordinator.controller.preset_tv()
 
         expected_cmd = coordinator.controller._build_command(RichmatCommands.PRESET_TV)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     async def test_preset_anti_snore(
         self,
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset anti-snore command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -339,8 +336,7 @@ class TestRichmatPresets:
         await coordinator.controller.preset_anti_snore()
 
         expected_cmd = coordinator.controller._build_command(RichmatCommands.PRESET_ANTI_SNORE)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     @pytest.mark.parametrize(
         "memory_num,expected_value",
@@ -354,7 +350,7 @@ class TestRichmatPresets:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_value: int,
     ):
@@ -365,8 +361,7 @@ class TestRichmatPresets:
         await coordinator.controller.preset_memory(memory_num)
 
         expected_cmd = coordinator.controller._build_command(expected_value)
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_cmd
+        assert first_write_data(mock_bleak_client) == expected_cmd
 
     @pytest.mark.parametrize(
         "memory_num,expected_value",
@@ -380,7 +375,7 @@ class TestRichmatPresets:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_value: int,
     ):
@@ -404,7 +399,7 @@ class TestRichmatLights:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test lights toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -426,7 +421,7 @@ class TestRichmatMassage:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -444,7 +439,7 @@ class TestRichmatMassage:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test head massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -462,7 +457,7 @@ class TestRichmatMassage:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test foot massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -480,7 +475,7 @@ class TestRichmatMassage:
         hass: HomeAssistant,
         mock_richmat_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage mode step command."""
         coordinator = AdjustableBedCoordinator(hass, mock_richmat_config_entry)
@@ -26,6 +26,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestSertaCommands:
     """Test Serta command constants."""
@@ -144,7 +146,7 @@ class TestSertaController:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -162,7 +164,7 @@ class TestSertaController:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command with repeat count."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -180,7 +182,7 @@ class TestSertaController:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -196,7 +198,7 @@ class TestSertaController:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command handles BleakError."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -216,7 +218,7 @@ class TestSertaMovement:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends commands followed by stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -228,8 +230,7 @@ class TestSertaMovement:
         assert len(calls) > 1
 
         # First call should be HEAD_UP
-        first_command = calls[0][0][1]
-        assert first_command == SertaCommands.HEAD_UP
+        assert first_write_data(mock_bleak_client) == SertaCommands.HEAD_UP
 
         # Last call should be stop
         last_command = calls[-1][0][1]
@@ -240,7 +241,7 @@ class TestSertaMovement:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down sends commands followed by stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -251,8 +252,7 @@ class TestSertaMovement:
         calls = mock_bleak_client.write_gatt_char.call_args_list
         assert len(calls) > 1
 
-        first_command = calls[0][0][1]
-        assert first_command == SertaCommands.HEAD_DOWN
+        assert first_write_data(mock_bleak_client) == SertaCommands.HEAD_DOWN
 
         last_command = calls[-1][0][1]
         assert last_command == SertaCommands.STOP
@@ -262,7 +262,7 @@ class TestSertaMovement:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move legs up sends FOOT_UP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -270,16 +270,14 @@ class TestSertaMovement:
 
         await coordinator.controller.move_legs_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == SertaCommands.FOOT_UP
+        assert first_write_data(mock_bleak_client) == SertaCommands.FOOT_UP
 
     async def test_move_feet_down(
         self,
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move feet down sends FOOT_DOWN command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -287,16 +285,14 @@ class TestSertaMovement:
 
         await coordinator.controller.move_feet_down()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == SertaCommands.FOOT_DOWN
+        assert first_write_data(mock_bleak_client) == SertaCommands.FOOT_DOWN
 
     async def test_stop_all(
         self,
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends stop command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -313,7 +309,7 @@ class TestSertaMovement:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move back up delegates to move head up."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -321,9 +317,7 @@ class TestSertaMovement:
 
         await coordinator.controller.move_back_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == SertaCommands.HEAD_UP
+        assert first_write_data(mock_bleak_client) == SertaCommands.HEAD_UP
 
 
 class TestSertaPresets:
@@ -334,7 +328,7 @@ class TestSertaPresets:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -342,15 +336,14 @@ class TestSertaPresets:
 
         await coordinator.controller.preset_flat()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SertaCommands.FLAT
+        assert first_write_data(mock_bleak_client) == SertaCommands.FLAT
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -358,15 +351,14 @@ class TestSertaPresets:
 
         await coordinator.controller.preset_zero_g()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SertaCommands.ZERO_G
+        assert first_write_data(mock_bleak_client) == SertaCommands.ZERO_G
 
     async def test_preset_tv(
         self,
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset TV command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -374,15 +366,14 @@ class TestSertaPresets:
 
         await coordinator.controller.preset_tv()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SertaCommands.TV
+        assert first_write_data(mock_bleak_client) == SertaCommands.TV
 
     async def test_preset_anti_snore(
         self,
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset anti-snore/lounge command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -390,15 +381,14 @@ class TestSertaPresets:
 
         await coordinator.controller.preset_anti_snore()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SertaCommands.LOUNGE
+        assert first_write_data(mock_bleak_client) == SertaCommands.LOUNGE
 
     async def test_preset_memory_not_supported(
         self,
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test preset memory logs warning (not supported on Serta)."""
@@ -418,7 +408,7 @@ class TestSertaProgramMemory:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         caplog,
     ):
         """Test program memory logs warning about not being supported."""
@@ -439,7 +429,7 @@ class TestSertaMassage:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage toggle command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -456,7 +446,7 @@ class TestSertaMassage:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test increase head massage intensity."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -473,7 +463,7 @@ class TestSertaMassage:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test decrease head massage intensity."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -490,7 +480,7 @@ class TestSertaMassage:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test increase foot massage intensity."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -507,7 +497,7 @@ class TestSertaMassage:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test decrease foot massage intensity."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
@@ -524,7 +514,7 @@ class TestSertaMassage:
         hass: HomeAssistant,
         mock_serta_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test massage timer step command."""
         coordinator = AdjustableBedCoordinator(hass, mock_serta_config_entry)
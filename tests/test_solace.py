@@ -26,6 +26,8 @@ from custom_components.adjustable_bed.const import (
 )
 from custom_components.adjustable_bed.coordinator import AdjustableBedCoordinator
 
+from .conftest import FakeBleakClient, first_write_data
+
 
 class TestSolaceCommands:
     """Test Solace command constants."""
@@ -124,7 +126,7 @@ class TestSolaceController:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing a command to the bed."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -142,7 +144,7 @@ class TestSolaceController:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test writing command when not connected raises error."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -162,7 +164,7 @@ class TestSolaceMovement:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head up sends BACK_UP followed by stop."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -174,8 +176,7 @@ class TestSolaceMovement:
         assert len(calls) > 1
 
         # First call should be BACK_UP
-        first_command = calls[0][0][1]
-        assert first_command == SolaceCommands.MOTOR_BACK_UP
+        assert first_write_data(mock_bleak_client) == SolaceCommands.MOTOR_BACK_UP
 
         # Last call should be stop
         last_command = calls[-1][0][1]
@@ -186,7 +187,7 @@ class TestSolaceMovement:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move head down sends BACK_DOWN command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -194,16 +195,14 @@ class TestSolaceMovement:
 
         await coordinator.controller.move_head_down()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == SolaceCommands.MOTOR_BACK_DOWN
+        assert first_write_data(mock_bleak_client) == SolaceCommands.MOTOR_BACK_DOWN
 
     async def test_move_legs_up(
         self,
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move legs up sends LEGS_UP command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -211,16 +210,14 @@ class TestSolaceMovement:
 
         await coordinator.controller.move_legs_up()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == SolaceCommands.MOTOR_LEGS_UP
+        assert first_write_data(mock_bleak_client) == SolaceCommands.MOTOR_LEGS_UP
 
     async def test_move_legs_down(
         self,
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test move legs down sends LEGS_DOWN command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -228,16 +225,14 @@ class TestSolaceMovement:
 
         await coordinator.controller.move_legs_down()
 
-        calls = mock_bleak_client.write_gatt_char.call_args_list
-        first_command = calls[0][0][1]
-        assert first_command == SolaceCommands.MOTOR_LEGS_DOWN
+        assert first_write_data(mock_bleak_client) == SolaceCommands.MOTOR_LEGS_DOWN
 
     async def test_stop_all(
         self,
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test stop all sends stop command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -258,7 +253,7 @@ class TestSolacePresets:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset flat command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -266,15 +261,14 @@ class TestSolacePresets:
 
         await coordinator.controller.preset_flat()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SolaceCommands.PRESET_ALL_FLAT
+        assert first_write_data(mock_bleak_client) == SolaceCommands.PRESET_ALL_FLAT
 
     async def test_preset_zero_g(
         self,
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset zero gravity command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -282,15 +276,14 @@ class TestSolacePresets:
 
         await coordinator.controller.preset_zero_g()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SolaceCommands.PRESET_ZERO_G
+        assert first_write_data(mock_bleak_client) == SolaceCommands.PRESET_ZERO_G
 
     async def test_preset_tv(
         self,
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset TV command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -298,15 +291,14 @@ class TestSolacePresets:
 
         await coordinator.controller.preset_tv()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SolaceCommands.PRESET_TV
+        assert first_write_data(mock_bleak_client) == SolaceCommands.PRESET_TV
 
     async def test_preset_anti_snore(
         self,
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
     ):
         """Test preset anti-snore command."""
         coordinator = AdjustableBedCoordinator(hass, mock_solace_config_entry)
@@ -314,8 +306,7 @@ class TestSolacePresets:
 
         await coordinator.controller.preset_anti_snore()
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == SolaceCommands.PRESET_ANTI_SNORE
+        assert first_write_data(mock_bleak_client) == SolaceCommands.PRESET_ANTI_SNORE
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
@@ -332,7 +323,7 @@ class TestSolacePresets:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: bytes,
     ):
@@ -342,8 +333,7 @@ class TestSolacePresets:
 
         await coordinator.controller.preset_memory(memory_num)
 
-        first_call = mock_bleak_client.write_gatt_char.call_args_list[0]
-        assert first_call[0][1] == expected_command
+        assert first_write_data(mock_bleak_client) == expected_command
 
     @pytest.mark.parametrize(
         "memory_num,expected_command",
@@ -360,7 +350,7 @@ class TestSolacePresets:
         hass: HomeAssistant,
         mock_solace_config_entry,
         mock_coordinator_connected,
-        mock_bleak_client: MagicMock,
+        mock_bleak_client: FakeBleakClient,
         memory_num: int,
         expected_command: bytes,
     ):